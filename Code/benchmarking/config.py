@@ -16,7 +16,10 @@ SA_STALL_LIMIT = 10000
 
 # Dynamic Programming parameters
 DP_MAX_COLORS = 20
-DP_MAX_VERTICES = 15  # Warn if graph larger than this
+DP_MAX_VERTICES = 40  # Skip the exact solver on larger graphs
+
+# Worker processes for benchmarking (None uses every CPU core)
+NUM_WORKERS = None
 
 # Number of trials per configuration
 NUM_TRIALS = 3
@@ -30,6 +33,7 @@ DATASET_PATH_REAL_WORLD = "data/real-world/"
 RESULTS_PATH = "results/"
 RESULTS_DATA_PATH = "results/data/"
 RESULTS_PLOTS_PATH = "results/plots/"
+GRAPH_CACHE_PATH = "results/cache/"
 
 # Benchmark datasets
 BENCHMARK_DATASETS = {
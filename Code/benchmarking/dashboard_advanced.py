@@ -24,7 +24,7 @@ from src.algorithms.simulated_annealing import simulated_annealing
 from src.algorithms.dynamic_programming import find_chromatic_number
 from src.utils.graph_generator import generate_erdos_renyi_graph, generate_petersen_graph
 from src.utils.graph_loader import load_karate_graph
-from src.utils.metrics import compute_all_metrics
+from src.utils.metrics import compute_all_metrics, ColoringMetrics
 
 
 def generate_complete_graph(n):
@@ -1431,7 +1431,7 @@ def main():
                 ec_data['error'] = wp_result['error']
             else:
                 ec_data['wp_colors'] = wp_result['num_colors']
-                ec_data['has_errors'] = sum(1 for u, v in G.edges() if wp_result['coloring'].get(u) == wp_result['coloring'].get(v)) > 0
+                ec_data['has_errors'] = not ColoringMetrics.is_valid_fast(G, wp_result['coloring'])
             
             ds_result = test_algorithm_on_graph(G, "D-Satur")
             if not ds_result['error']:
@@ -11,7 +11,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import networkx as nx
 from src.algorithms.welshpowell import welsh_powell, validate_coloring as wp_validate
 from src.algorithms.dsatur import dsatur, validate_coloring as ds_validate
-from src.algorithms.simulated_annealing import simulated_annealing, validate_coloring as sa_validate
+from src.algorithms.simulated_annealing import (
+    simulated_annealing, simulated_annealing_csr, run_parallel_sa, count_conflicts,
+    validate_coloring as sa_validate
+)
+from src.utils.graph_arrays import graph_to_csr
+from src.utils.graph_loader import load_dimacs_graph
 from src.algorithms.dynamic_programming import find_chromatic_number, validate_coloring as dp_validate
 
 
@@ -155,6 +160,104 @@ def test_karate_club():
     print(f"✓ Simulated Annealing: {k_sa} colors (time={time_s:.3f}s)")
 
 
+
+def test_simulated_annealing_csr():
+    """Test SA on CSR arrays: Petersen graph is 3-colorable"""
+    print("\n=== Test: Simulated Annealing on CSR ===")
+    G = nx.petersen_graph()
+    indptr, indices, nodes = graph_to_csr(G)
+    
+    colors, k_sa, history, time_s = simulated_annealing_csr(indptr, indices, 3, seed=42)
+    coloring = dict(zip(nodes, colors.tolist()))
+    assert len(colors) == G.number_of_nodes(), f"SA-CSR colored {len(colors)} vertices"
+    assert sa_validate(G, coloring), "SA-CSR produced invalid coloring"
+    assert history[-1] == 0, f"SA-CSR ended with {history[-1]} conflicts"
+    assert k_sa <= 3, f"SA-CSR: expected at most 3 colors, got {k_sa}"
+    print(f"✓ Simulated Annealing (CSR): {k_sa} colors (time={time_s:.3f}s)")
+
+
+
+def test_parallel_simulated_annealing():
+    """Test parallel SA chains: best chain kept, valid, and reproducible"""
+    print("\n=== Test: Parallel Simulated Annealing ===")
+    G = nx.petersen_graph()
+    
+    # Petersen is 3-colorable, so the best of two chains is a proper coloring
+    coloring, k_sa, history, time_s = run_parallel_sa(G, 3, n_chains=2, base_seed=7)
+    assert sa_validate(G, coloring), "Parallel SA produced invalid coloring"
+    assert k_sa <= 3, f"Parallel SA: expected at most 3 colors, got {k_sa}"
+    
+    # With 2 colors no chain can reach 0 conflicts; from base seed 6 the
+    # second chain ends with fewer, so it is the one returned
+    sa_kwargs = {'max_iterations': 50, 'stall_limit': 50}
+    chains = [simulated_annealing(G, 2, seed=6 + i, **sa_kwargs)[0] for i in range(2)]
+    assert count_conflicts(G, chains[1]) < count_conflicts(G, chains[0])
+    coloring, _, _, _ = run_parallel_sa(G, 2, n_chains=2, base_seed=6, **sa_kwargs)
+    assert coloring == chains[1], "Parallel SA did not keep the minimum-conflict chain"
+    
+    # A fixed seed gives the same output on every run
+    again, _, _, _ = run_parallel_sa(G, 2, n_chains=2, base_seed=6, **sa_kwargs)
+    assert again == coloring, "Parallel SA is not reproducible with a fixed seed"
+    print(f"✓ Parallel SA: {k_sa} colors (time={time_s:.3f}s)")
+
+
+def _brute_force_chromatic(G):
+    """Chromatic number by enumerating every partition of the vertices."""
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    edges = [(index[u], index[v]) for u, v in G.edges()]
+    best = len(nodes)
+    
+    # Restricted growth strings list each partition once: vertex i joins
+    # one of the blocks used so far or opens the next one
+    def assign(i, colors, used):
+        nonlocal best
+        if used >= best:
+            return
+        if i == len(nodes):
+            if all(colors[u] != colors[v] for u, v in edges):
+                best = used
+            return
+        for c in range(used + 1):
+            colors[i] = c
+            assign(i + 1, colors, max(used, c + 1))
+    
+    assign(0, [0] * len(nodes), 0)
+    return best
+
+
+def test_dp_against_brute_force():
+    """Test DP chromatic number against exhaustive search and known values"""
+    print("\n=== Test: DP vs Brute Force ===")
+    graphs = {}
+    for seed in range(30):
+        n = 2 + seed % 8
+        graphs[f'gnp_{seed}'] = nx.gnp_random_graph(n, 0.2 + 0.02 * seed, seed=seed)
+    
+    for name, G in graphs.items():
+        k_dp, coloring_dp = find_chromatic_number(G)
+        expected = _brute_force_chromatic(G)
+        assert k_dp == expected, f"{name}: DP found {k_dp}, brute force {expected}"
+        assert dp_validate(G, coloring_dp), f"{name}: DP produced invalid coloring"
+        assert len(set(coloring_dp.values())) == k_dp, f"{name}: coloring uses wrong count"
+    print(f"✓ DP matches brute force on {len(graphs)} random graphs")
+    
+    # Graphs with a known chromatic number
+    known = {
+        'cycle_5': (nx.cycle_graph(5), 3),
+        'cycle_9': (nx.cycle_graph(9), 3),
+        'myciel3': (load_dimacs_graph(os.path.join(os.path.dirname(__file__), '..', 'data', 'dimacs', 'myciel3.col')), 4),
+    }
+    for n in range(1, 8):
+        known[f'complete_{n}'] = (nx.complete_graph(n), n)
+    
+    for name, (G, chi) in known.items():
+        k_dp, coloring_dp = find_chromatic_number(G)
+        assert k_dp == chi, f"{name}: expected {chi} colors, got {k_dp}"
+        assert dp_validate(G, coloring_dp), f"{name}: DP produced invalid coloring"
+    print(f"✓ DP matches known chromatic numbers on {len(known)} graphs")
+
+
 def run_all_tests():
     """Run all correctness tests."""
     print("="*60)
@@ -168,7 +271,10 @@ def run_all_tests():
         test_cycle_odd()
         test_petersen()
         test_karate_club()
-        
+        test_dp_against_brute_force()
+        test_simulated_annealing_csr()
+        test_parallel_simulated_annealing()
+    
         print("\n" + "="*60)
         print("✓ ALL TESTS PASSED")
         print("="*60)
@@ -0,0 +1,197 @@
+"""
+Unit Tests for Graph Utilities
+
+Tests the random graph generators, the graph loaders and graph metrics on
+small inputs with known answers.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import math
+import networkx as nx
+import numpy as np
+from src.utils.graph_generator import generate_erdos_renyi_graph, generate_bipartite_graph
+from src.utils.graph_loader import load_dimacs_graph, load_dimacs_csr
+from src.utils.metrics import GraphMetrics
+
+
+def _write_dimacs(text):
+    """Write DIMACS text to a temporary .col file and return its path."""
+    fd, path = tempfile.mkstemp(suffix='.col')
+    with os.fdopen(fd, 'w') as f:
+        f.write(text)
+    return path
+
+
+def _csr_edge_set(indptr, indices):
+    """Undirected edges of a CSR adjacency as a set of (low, high) index pairs."""
+    edges = set()
+    for i in range(len(indptr) - 1):
+        for j in indices[indptr[i]:indptr[i + 1]].tolist():
+            edges.add((min(i, j), max(i, j)))
+    return edges
+
+
+def test_dimacs_csr_loader():
+    """Test that load_dimacs_csr matches load_dimacs_graph"""
+    print("\n=== Test: DIMACS CSR loader ===")
+    with open(os.path.join(os.path.dirname(__file__), '..', 'data', 'dimacs', 'myciel3.col')) as f:
+        myciel3 = f.read()
+    
+    cases = {
+        # 1-based labels, a reversed duplicate edge and a self-loop
+        'mixed': "c sample\np edge 5 5\ne 1 2\ne 2 3\ne 3 2\ne 4 4\ne 5 1\n",
+        'header_only': "c no edges\np edge 4 0\n",
+        'myciel3': myciel3,
+    }
+    
+    for name, text in cases.items():
+        path = _write_dimacs(text)
+        try:
+            G = load_dimacs_graph(path)
+            num_vertices, indptr, indices = load_dimacs_csr(path)
+        finally:
+            os.remove(path)
+    
+        expected = {(min(u, v) - 1, max(u, v) - 1) for u, v in G.edges()}
+        assert _csr_edge_set(indptr, indices) == expected, f"{name}: edge sets differ"
+        assert len(indptr) == num_vertices + 1, f"{name}: indptr length {len(indptr)}"
+        assert num_vertices >= G.number_of_nodes(), f"{name}: {num_vertices} vertices"
+        assert np.all(np.diff(indptr) >= 0), f"{name}: indptr not monotone"
+    
+        # Every proper edge is listed from both ends, a self-loop once
+        loops = sum(1 for u, v in expected if u == v)
+        assert len(indices) == 2 * len(expected) - loops, f"{name}: {len(indices)} entries"
+        print(f"✓ {name}: {num_vertices} vertices, {len(expected)} edges")
+    
+    # The header sets the vertex count even when no edge names a vertex
+    path = _write_dimacs(cases['header_only'])
+    try:
+        num_vertices, indptr, indices = load_dimacs_csr(path)
+    finally:
+        os.remove(path)
+    assert num_vertices == 4 and len(indices) == 0, "header-only file misread"
+
+
+def test_erdos_renyi_generator():
+    """Test the geometric-skip G(n, p) sampler"""
+    print("\n=== Test: Erdos-Renyi generator ===")
+    n = 200
+    G = generate_erdos_renyi_graph(n, 0.05, seed=3)
+    assert sorted(G.nodes()) == list(range(n)), "ER: wrong vertex set"
+    assert nx.number_of_selfloops(G) == 0, "ER: self-loop generated"
+    
+    # Near p = 1 every pair position is drawn, so a decoding slip would
+    # show up as a missing or out-of-range pair
+    dense = generate_erdos_renyi_graph(30, 1 - 1e-9, seed=3)
+    assert dense.number_of_edges() == 30 * 29 // 2, "ER: pair decoding missed pairs"
+    assert sorted(dense.nodes()) == list(range(30)), "ER: pair decoded out of range"
+    
+    # Edge cases short-circuit
+    assert generate_erdos_renyi_graph(10, 0.0, seed=1).number_of_edges() == 0
+    assert generate_erdos_renyi_graph(10, -0.5, seed=1).number_of_edges() == 0
+    assert generate_erdos_renyi_graph(10, 1.0, seed=1).number_of_edges() == 45
+    assert generate_erdos_renyi_graph(10, 1.5, seed=1).number_of_edges() == 45
+    assert generate_erdos_renyi_graph(1, 0.5, seed=1).number_of_nodes() == 1
+    
+    # Same seed, same graph; another seed, another graph
+    again = generate_erdos_renyi_graph(n, 0.05, seed=3)
+    assert sorted(again.edges()) == sorted(G.edges()), "ER: not reproducible"
+    other = generate_erdos_renyi_graph(n, 0.05, seed=4)
+    assert sorted(other.edges()) != sorted(G.edges()), "ER: seed ignored"
+    
+    # Edge count within 5 standard deviations of its binomial mean
+    pairs = n * (n - 1) // 2
+    mean, sd = pairs * 0.05, math.sqrt(pairs * 0.05 * 0.95)
+    assert abs(G.number_of_edges() - mean) < 5 * sd, f"ER: {G.number_of_edges()} edges"
+    print(f"✓ Erdos-Renyi: {G.number_of_edges()} edges (expected ~{mean:.0f})")
+
+
+def test_bipartite_generator():
+    """Test the geometric-skip random bipartite sampler"""
+    print("\n=== Test: Bipartite generator ===")
+    n1, n2 = 40, 60
+    G = generate_bipartite_graph(n1, n2, 0.1, seed=5)
+    side_a = {f"A{i}" for i in range(n1)}
+    side_b = {f"B{j}" for j in range(n2)}
+    assert set(G.nodes()) == side_a | side_b, "Bipartite: wrong vertex set"
+    assert all((u in side_a) != (v in side_a) for u, v in G.edges()), "Bipartite: edge inside a side"
+    assert nx.is_bipartite(G), "Bipartite: graph is not bipartite"
+    
+    # Near p = 1 every cross pair is drawn exactly once
+    dense = generate_bipartite_graph(7, 9, 1 - 1e-9, seed=5)
+    assert dense.number_of_edges() == 7 * 9, "Bipartite: pair decoding missed pairs"
+    assert dense.number_of_nodes() == 7 + 9, "Bipartite: pair decoded out of range"
+    
+    # Edge cases short-circuit
+    assert generate_bipartite_graph(5, 6, 0.0, seed=1).number_of_edges() == 0
+    assert generate_bipartite_graph(5, 6, 1.0, seed=1).number_of_edges() == 30
+    assert generate_bipartite_graph(0, 6, 0.5, seed=1).number_of_edges() == 0
+    
+    # Same seed, same graph; another seed, another graph
+    again = generate_bipartite_graph(n1, n2, 0.1, seed=5)
+    assert sorted(again.edges()) == sorted(G.edges()), "Bipartite: not reproducible"
+    other = generate_bipartite_graph(n1, n2, 0.1, seed=6)
+    assert sorted(other.edges()) != sorted(G.edges()), "Bipartite: seed ignored"
+    
+    # Edge count within 5 standard deviations of its binomial mean
+    mean, sd = n1 * n2 * 0.1, math.sqrt(n1 * n2 * 0.1 * 0.9)
+    assert abs(G.number_of_edges() - mean) < 5 * sd, f"Bipartite: {G.number_of_edges()} edges"
+    print(f"✓ Bipartite: {G.number_of_edges()} edges (expected ~{mean:.0f})")
+
+
+def test_degeneracy():
+    """Test that the bucket-peel degeneracy matches networkx core numbers"""
+    print("\n=== Test: Degeneracy ===")
+    graphs = {
+        'empty': nx.empty_graph(8),
+        'null': nx.Graph(),
+        'petersen': nx.petersen_graph(),
+        'complete_7': nx.complete_graph(7),
+        'star_9': nx.star_graph(9),
+        'karate': nx.karate_club_graph(),
+    }
+    for seed in range(20):
+        graphs[f'gnp_{seed}'] = nx.gnp_random_graph(10 + 3 * seed, 0.05 + 0.02 * seed, seed=seed)
+    
+    for name, G in graphs.items():
+        expected = max(nx.core_number(G).values(), default=0)
+        result = GraphMetrics.degeneracy(G)
+        assert result == expected, f"{name}: degeneracy {result}, core number {expected}"
+        assert GraphMetrics.degeneracy(G, dict(G.degree())) == expected, f"{name}: degrees argument"
+    print(f"✓ Degeneracy matches core numbers on {len(graphs)} graphs")
+
+
+def run_all_tests():
+    """Run all utility tests."""
+    print("="*60)
+    print("GRAPH UTILITY TESTS")
+    print("="*60)
+    
+    try:
+        test_erdos_renyi_generator()
+        test_bipartite_generator()
+        test_dimacs_csr_loader()
+        test_degeneracy()
+    
+        print("\n" + "="*60)
+        print("✓ ALL TESTS PASSED")
+        print("="*60)
+        return True
+    
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        return False
+    except Exception as e:
+        print(f"\n✗ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
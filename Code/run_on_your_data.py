@@ -10,9 +10,13 @@ Tests all hybrid algorithms on:
 import sys
 import os
 import time
+import csv
+import json
+import traceback
 sys.path.insert(0, os.path.dirname(__file__))
 
 import networkx as nx
+import numpy as np
 from src.algorithms import (
     # Base algorithms
     welsh_powell,
@@ -27,6 +31,23 @@ from src.algorithms import (
     adaptive_hybrid
 )
 
+# Fixed schema of the per-run results table (one list per column)
+RESULT_COLUMNS = ('dataset', 'algorithm', 'colors', 'time', 'valid')
+
+def new_results_table():
+    """Create an empty column-oriented results table"""
+    return {column: [] for column in RESULT_COLUMNS}
+
+def append_result_row(table, result):
+    """Append a successful run to the results table; failed runs are skipped"""
+    if 'error' in result:
+        return
+    table['dataset'].append(result.get('dataset', 'unknown'))
+    table['algorithm'].append(result['algorithm'])
+    table['colors'].append(result['colors'])
+    table['time'].append(result['time'])
+    table['valid'].append(result['valid'])
+
 def load_dimacs_graph(filepath):
     """Load DIMACS format graph (.col file)"""
     G = nx.Graph()
@@ -50,7 +71,6 @@ def load_karate_graph(filepath):
 
 def load_exam_scheduling_graph(filepath):
     """Load exam scheduling graph from CSV"""
-    import csv
     G = nx.Graph()
     courses = {}
     
@@ -74,6 +94,12 @@ def load_exam_scheduling_graph(filepath):
     
     return G
 
+def is_valid_coloring(G, coloring):
+    """Check that every vertex is colored and no edge joins two same-colored vertices"""
+    if any(v not in coloring for v in G):
+        return False
+    return all(coloring[u] != coloring[v] for u, v in G.edges())
+
 def run_algorithm(name, func, G, seed=42):
     """Run a single algorithm and return results"""
     start = time.perf_counter()
@@ -109,11 +135,7 @@ def run_algorithm(name, func, G, seed=42):
         elapsed = time.perf_counter() - start
         
         # Validate
-        valid = True
-        for u, v in G.edges():
-            if coloring[u] == coloring[v]:
-                valid = False
-                break
+        valid = is_valid_coloring(G, coloring)
         
         return {
             'algorithm': name,
@@ -123,7 +145,6 @@ def run_algorithm(name, func, G, seed=42):
             'stats': stats
         }
     except Exception as e:
-        import traceback
         return {
             'algorithm': name,
             'error': str(e),
@@ -132,17 +153,19 @@ def run_algorithm(name, func, G, seed=42):
         }
 
 def print_results(dataset_name, G, results):
-    """Print formatted results"""
-    print(f"\n{'='*100}")
-    print(f"DATASET: {dataset_name}")
-    print(f"Nodes: {G.number_of_nodes()}, Edges: {G.number_of_edges()}, Density: {nx.density(G):.4f}")
-    print(f"{'='*100}")
-    print(f"{'Algorithm':<30} {'Colors':<10} {'Time (s)':<12} {'Valid':<8} {'Details'}")
-    print(f"{'-'*100}")
+    """Print formatted results as a single buffered write"""
+    lines = [
+        f"\n{'='*100}",
+        f"DATASET: {dataset_name}",
+        f"Nodes: {G.number_of_nodes()}, Edges: {G.number_of_edges()}, Density: {nx.density(G):.4f}",
+        f"{'='*100}",
+        f"{'Algorithm':<30} {'Colors':<10} {'Time (s)':<12} {'Valid':<8} {'Details'}",
+        f"{'-'*100}",
+    ]
     
     for r in results:
         if 'error' in r:
-            print(f"{r['algorithm']:<30} {'ERROR':<10} {r['time']:>10.4f}   {'✗':<8} {r['error'][:60]}")
+            lines.append(f"{r['algorithm']:<30} {'ERROR':<10} {r['time']:>10.4f}   {'✗':<8} {r['error'][:60]}")
         else:
             details = []
             if 'dsatur_colors' in r['stats']:
@@ -157,7 +180,9 @@ def print_results(dataset_name, G, results):
                 details.append(f"Selected:{r['stats']['selected_algorithm']}")
             
             valid_mark = '✓' if r['valid'] else '✗'
-            print(f"{r['algorithm']:<30} {r['colors']:<10} {r['time']:>10.4f}   {valid_mark:<8} {', '.join(details)}")
+            lines.append(f"{r['algorithm']:<30} {r['colors']:<10} {r['time']:>10.4f}   {valid_mark:<8} {', '.join(details)}")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 def main():
     print("\n╔" + "═"*98 + "╗")
@@ -184,6 +209,7 @@ def main():
     ]
     
     all_results = []
+    table = new_results_table()
     
     # 1. DIMACS Graphs
     print("\n" + "="*100)
@@ -209,6 +235,7 @@ def main():
             result['dataset'] = name
             results.append(result)
             all_results.append(result)
+            append_result_row(table, result)
         
         print_results(name, G, results)
     
@@ -229,6 +256,7 @@ def main():
             result['dataset'] = 'Karate Club'
             results.append(result)
             all_results.append(result)
+            append_result_row(table, result)
         
         print_results('Karate Club Network', G, results)
     
@@ -244,6 +272,7 @@ def main():
             result['dataset'] = 'Exam Scheduling'
             results.append(result)
             all_results.append(result)
+            append_result_row(table, result)
         
         print_results('Exam Scheduling (Course Conflicts)', G, results)
     
@@ -252,19 +281,15 @@ def main():
     print("SUMMARY - ALGORITHM COMPARISON")
     print("="*100)
     
-    algo_stats = {}
-    for r in all_results:
-        if 'error' in r:
-            continue
-        algo = r['algorithm']
-        if algo not in algo_stats:
-            algo_stats[algo] = {'colors': [], 'times': [], 'datasets': []}
-        algo_stats[algo]['colors'].append(r['colors'])
-        algo_stats[algo]['times'].append(r['time'])
-        algo_stats[algo]['datasets'].append(r['dataset'])
+    # Per-algorithm reductions over the results table columns
+    algo_column = np.array(table['algorithm'])
+    color_column = np.array(table['colors'], dtype=float)
+    time_column = np.array(table['time'], dtype=float)
     
-    print(f"\n{'Algorithm':<30} {'Avg Colors':<15} {'Avg Time (s)':<15} {'Datasets Tested'}")
-    print("-"*100)
+    lines = [
+        f"\n{'Algorithm':<30} {'Avg Colors':<15} {'Avg Time (s)':<15} {'Datasets Tested'}",
+        "-"*100,
+    ]
     
     # Order by category
     algo_order = [
@@ -275,12 +300,14 @@ def main():
     ]
     
     for algo in algo_order:
-        if algo in algo_stats:
-            stats = algo_stats[algo]
-            avg_colors = sum(stats['colors']) / len(stats['colors'])
-            avg_time = sum(stats['times']) / len(stats['times'])
-            n_datasets = len(stats['datasets'])
-            print(f"{algo:<30} {avg_colors:>13.2f}   {avg_time:>13.4f}   {n_datasets}")
+        mask = algo_column == algo
+        n_datasets = int(np.count_nonzero(mask))
+        if n_datasets:
+            avg_colors = color_column[mask].mean()
+            avg_time = time_column[mask].mean()
+            lines.append(f"{algo:<30} {avg_colors:>13.2f}   {avg_time:>13.4f}   {n_datasets}")
+    
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     # Save results
     print("\n" + "="*100)
@@ -289,25 +316,15 @@ def main():
     
     os.makedirs('results/data', exist_ok=True)
     
-    import json
     with open('results/data/your_datasets_results.json', 'w') as f:
         json.dump(all_results, f, indent=2)
     print("✓ Saved to: results/data/your_datasets_results.json")
     
-    import csv
-    with open('results/data/your_datasets_results.csv', 'w', newline='') as f:
+    with open('results/data/your_datasets_results.csv', 'w', newline='', buffering=1 << 20) as f:
         if all_results:
-            writer = csv.DictWriter(f, fieldnames=['dataset', 'algorithm', 'colors', 'time', 'valid'])
-            writer.writeheader()
-            for r in all_results:
-                if 'error' not in r:
-                    writer.writerow({
-                        'dataset': r.get('dataset', 'unknown'),
-                        'algorithm': r['algorithm'],
-                        'colors': r['colors'],
-                        'time': r['time'],
-                        'valid': r['valid']
-                    })
+            writer = csv.writer(f)
+            writer.writerow(RESULT_COLUMNS)
+            writer.writerows(zip(*(table[column] for column in RESULT_COLUMNS)))
     print("✓ Saved to: results/data/your_datasets_results.csv")
     
     print("\n" + "="*100)
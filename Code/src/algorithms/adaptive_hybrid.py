@@ -31,6 +31,7 @@ import random
 import math
 from typing import Dict, Tuple, List, Optional, Any
 import networkx as nx
+from ..utils.graph_arrays import edge_index_arrays, coloring_array
 
 
 def analyze_graph_characteristics(G: nx.Graph) -> Dict[str, Any]:
@@ -192,42 +193,36 @@ def greedy_dsatur(G: nx.Graph) -> Tuple[Dict[int, int], int]:
     if G is None or len(G) == 0:
         return {}, 0
     
-    coloring = {v: None for v in G.nodes()}
-    saturation_degree = {v: set() for v in G.nodes()}
-    vertex_degrees = dict(G.degree())
-    uncolored = set(G.nodes())
-    
-    if uncolored:
-        start_vertex = max(uncolored, key=lambda v: vertex_degrees[v])
-        coloring[start_vertex] = 0
-        uncolored.remove(start_vertex)
-        for neighbor in G.neighbors(start_vertex):
-            saturation_degree[neighbor].add(0)
-    
-    while uncolored:
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    neighbors = [[index[u] for u in G.adj[v]] for v in nodes]
+    vertex_degrees = [len(nbrs) for nbrs in neighbors]
+    color_of = [-1] * len(nodes)
+    sat_mask = [0] * len(nodes)
+    saturation = [0] * len(nodes)
+    uncolored = list(range(len(nodes)))
+    
+    next_vertex = max(uncolored, key=vertex_degrees.__getitem__)
+    while True:
+        mask = sat_mask[next_vertex]
+        color = ((mask + 1) & ~mask).bit_length() - 1
+        color_of[next_vertex] = color
+        uncolored.remove(next_vertex)
+        
+        bit = 1 << color
+        for j in neighbors[next_vertex]:
+            if color_of[j] < 0 and not sat_mask[j] & bit:
+                sat_mask[j] |= bit
+                saturation[j] += 1
+        
+        if not uncolored:
+            break
         next_vertex = max(
             uncolored,
-            key=lambda v: (len(saturation_degree[v]), vertex_degrees[v])
+            key=lambda i: (saturation[i], vertex_degrees[i])
         )
-        
-        neighbor_colors = set()
-        for neighbor in G.neighbors(next_vertex):
-            if coloring[neighbor] is not None:
-                neighbor_colors.add(coloring[neighbor])
-        
-        color = 0
-        while color in neighbor_colors:
-            color += 1
-        
-        coloring[next_vertex] = color
-        uncolored.remove(next_vertex)
-        
-        for neighbor in G.neighbors(next_vertex):
-            if coloring[neighbor] is None:
-                saturation_degree[neighbor].add(color)
     
-    num_colors = max(coloring.values()) + 1 if coloring else 0
-    return coloring, num_colors
+    return dict(zip(nodes, color_of)), max(color_of) + 1
 
 
 def greedy_welsh_powell(G: nx.Graph) -> Tuple[Dict[int, int], int]:
@@ -256,7 +251,9 @@ def greedy_welsh_powell(G: nx.Graph) -> Tuple[Dict[int, int], int]:
 def adaptive_hybrid(
     G: nx.Graph,
     seed: Optional[int] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    initial_coloring: Optional[Dict[int, int]] = None,
+    random_state: Optional[random.Random] = None
 ) -> Tuple[Dict[int, int], int, Dict]:
     """
     Adaptive hybrid graph coloring algorithm.
@@ -274,6 +271,10 @@ def adaptive_hybrid(
         G (nx.Graph): NetworkX graph object to color
         seed (int, optional): Random seed for reproducibility
         verbose (bool): If True, print algorithm selection info
+        initial_coloring (Dict[int, int], optional): Precomputed valid coloring
+            forwarded to the selected hybrid algorithm as its starting point
+        random_state (random.Random, optional): Shared generator forwarded to
+            the selected hybrid algorithm instead of re-seeding from seed
     
     Returns:
         Tuple[Dict[int, int], int, Dict]:
@@ -331,19 +332,28 @@ def adaptive_hybrid(
         elif algorithm_name == 'hybrid_dsatur_sa':
             # Import and use DSatur+SA
             from .hybrid_dsatur_sa import hybrid_dsatur_sa
-            coloring, num_colors, algo_stats = hybrid_dsatur_sa(G, seed=seed, **params)
+            coloring, num_colors, algo_stats = hybrid_dsatur_sa(
+                G, seed=seed, initial_coloring=initial_coloring,
+                random_state=random_state, **params
+            )
             stats.update(algo_stats)
         
         elif algorithm_name == 'hybrid_wp_sa':
             # Import and use WP+SA
             from .hybrid_wp_sa import hybrid_wp_sa
-            coloring, num_colors, algo_stats = hybrid_wp_sa(G, seed=seed, **params)
+            coloring, num_colors, algo_stats = hybrid_wp_sa(
+                G, seed=seed, initial_coloring=initial_coloring,
+                random_state=random_state, **params
+            )
             stats.update(algo_stats)
         
         elif algorithm_name == 'hybrid_tabu':
             # Import and use Tabu Search
             from .hybrid_tabu import hybrid_tabu
-            coloring, num_colors, algo_stats = hybrid_tabu(G, seed=seed, **params)
+            coloring, num_colors, algo_stats = hybrid_tabu(
+                G, seed=seed, initial_coloring=initial_coloring,
+                random_state=random_state, **params
+            )
             stats.update(algo_stats)
         
         elif algorithm_name == 'dsatur':
@@ -384,7 +394,6 @@ def validate_coloring(G: nx.Graph, coloring: Dict[int, int]) -> bool:
     Returns:
         bool: True if coloring is valid, False otherwise
     """
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            return False
-    return True
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    colors = coloring_array(nodes, coloring)
+    return not (colors[u_arr] == colors[v_arr]).any()
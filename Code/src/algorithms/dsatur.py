@@ -8,8 +8,8 @@ Description:
     breaking ties using vertex degree.
 
     Time Complexity: O(V^2)
-    Space Complexity: O(V)
-    where V = number of vertices
+    Space Complexity: O(V + E)
+    where V = number of vertices, E = number of edges
 
     The D-Satur algorithm typically produces better colorings than Welsh-Powell
     for many graph classes, as it prioritizes vertices with more constrained neighborhoods.
@@ -20,7 +20,8 @@ Reference:
     Communications of the ACM, 22(4), 251-256.
 """
 
-from typing import Dict, Tuple, Set
+from typing import Dict, Tuple
+from collections import Counter
 import networkx as nx
 
 
@@ -59,61 +60,55 @@ def dsatur(G: nx.Graph, tie_break: str = 'degree') -> Tuple[Dict[int, int], int]
     if G is None or len(G) == 0:
         return {}, 0
     
-    # Initialize data structures
-    coloring = {v: None for v in G.nodes()}  # None means uncolored
-    saturation_degree = {v: set() for v in G.nodes()}  # Set of colors used by neighbors
-    vertex_degrees = dict(G.degree())  # Static vertex degrees
+    # Relabel vertices to 0..V-1 once so all per-vertex state lives in
+    # plain lists indexed by integer vertex ID
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    neighbors = [[index[u] for u in G.adj[v]] for v in nodes]
+    vertex_degrees = [len(nbrs) for nbrs in neighbors]  # Static vertex degrees
+    n = len(nodes)
     
-    uncolored = set(G.nodes())
+    color_of = [-1] * n  # -1 means uncolored
+    sat_mask = [0] * n  # Bit c set when some colored neighbor uses color c
+    saturation = [0] * n  # Number of distinct neighbor colors (popcount of sat_mask)
     
-    # Start with a vertex: pick one with highest degree
-    if uncolored:
-        start_vertex = max(uncolored, key=lambda v: vertex_degrees[v])
+    uncolored = list(range(n))
+    
+    # Start with the highest-degree vertex; after that, select by max
+    # saturation degree, breaking ties by vertex degree
+    next_vertex = max(uncolored, key=vertex_degrees.__getitem__)
+    
+    while True:
+        # Smallest color not used by neighbors: lowest zero bit of sat_mask
+        mask = sat_mask[next_vertex]
+        color = ((mask + 1) & ~mask).bit_length() - 1
         
-        # Color the starting vertex with color 0
-        coloring[start_vertex] = 0
-        uncolored.remove(start_vertex)
+        color_of[next_vertex] = color
+        uncolored.remove(next_vertex)
+        
+        # Update saturation degree of uncolored neighbors
+        bit = 1 << color
+        for j in neighbors[next_vertex]:
+            if color_of[j] < 0 and not sat_mask[j] & bit:
+                sat_mask[j] |= bit
+                saturation[j] += 1
+        
+        if not uncolored:
+            break
         
-        # Update saturation degree of neighbors
-        for neighbor in G.neighbors(start_vertex):
-            saturation_degree[neighbor].add(0)
-    
-    # Main coloring loop
-    while uncolored:
         # Select next vertex: max saturation degree, break ties by vertex degree
         if tie_break == 'degree':
             next_vertex = max(
                 uncolored,
-                key=lambda v: (len(saturation_degree[v]), vertex_degrees[v])
+                key=lambda i: (saturation[i], vertex_degrees[i])
             )
         else:
             # For random tie-breaking, use saturation degree as primary sort
-            next_vertex = max(
-                uncolored,
-                key=lambda v: len(saturation_degree[v])
-            )
-        
-        # Find the smallest color not used by neighbors
-        neighbor_colors = set()
-        for neighbor in G.neighbors(next_vertex):
-            if coloring[neighbor] is not None:
-                neighbor_colors.add(coloring[neighbor])
-        
-        # Assign smallest available color
-        color = 0
-        while color in neighbor_colors:
-            color += 1
-        
-        coloring[next_vertex] = color
-        uncolored.remove(next_vertex)
-        
-        # Update saturation degree of uncolored neighbors
-        for neighbor in G.neighbors(next_vertex):
-            if neighbor in uncolored:
-                saturation_degree[neighbor].add(color)
+            next_vertex = max(uncolored, key=saturation.__getitem__)
     
-    # Calculate number of colors used
-    num_colors = max(coloring.values()) + 1 if coloring else 0
+    # Map colors back to the original vertex labels
+    coloring = dict(zip(nodes, color_of))
+    num_colors = max(color_of) + 1
     
     return coloring, num_colors
 
@@ -146,8 +141,6 @@ def get_color_statistics(G: nx.Graph, coloring: Dict[int, int]) -> Dict:
     Returns:
         Dict: Statistics including number of colors, validity, graph properties
     """
-    from collections import Counter
-    
     if not coloring:
         return {}
     
@@ -160,5 +153,5 @@ def get_color_statistics(G: nx.Graph, coloring: Dict[int, int]) -> Dict:
         'edges': G.number_of_edges(),
         'density': nx.density(G),
         'color_distribution': dict(color_counts),
-        'max_degree': max(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0
+        'max_degree': max((d for _, d in G.degree()), default=0)
     }
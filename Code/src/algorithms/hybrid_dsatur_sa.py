@@ -10,7 +10,7 @@ Description:
     This hybrid approach often achieves better results than either algorithm alone,
     balancing speed and solution quality.
 
-    Time Complexity: O(V^2 + max_iterations * E)
+    Time Complexity: O((V + E) log V + max_iterations * max_degree)
     Space Complexity: O(V)
     where V = number of vertices, E = number of edges
 
@@ -24,73 +24,130 @@ Reference:
     Combining constructive heuristics with local search often yields state-of-the-art results.
 """
 
+import heapq
 import random
 import math
 from typing import Dict, Tuple, List, Optional, Set
 import networkx as nx
+import numpy as np
+from .simulated_annealing import FROZEN_TEMPERATURE
+from ..utils.graph_arrays import (
+    graph_to_csr, csr_neighbor_lists, edge_index_arrays, coloring_array,
+    count_conflicts_np, conflicting_vertices_np
+)
 
 
-def dsatur_initial_coloring(G: nx.Graph) -> Tuple[Dict[int, int], int]:
+# Modified Lam cooling: the acceptance rate is an exponential moving average
+# over roughly the last 500 moves, and T is nudged by 0.1% per iteration
+LAM_RATE_DECAY = 0.998
+LAM_STEP = 0.999
+
+
+def lam_target_rate(progress: float) -> float:
+    """
+    Target acceptance rate of the Modified Lam schedule (Swartz, 1993).
+    
+    Args:
+        progress (float): Fraction of the iteration budget used, in [0, 1)
+    
+    Returns:
+        float: Desired fraction of accepted moves at this point of the run
+    """
+    if progress < 0.15:
+        return 0.44 + 0.56 * 560 ** (-progress / 0.15)
+    if progress < 0.65:
+        return 0.44
+    return 0.44 * 440 ** (-(progress - 0.65) / 0.35)
+
+
+def dsatur_initial_coloring(G: nx.Graph,
+                            max_colors: Optional[int] = None) -> Tuple[Optional[Dict[int, int]], int]:
     """
     Generate initial coloring using DSatur algorithm.
     
     Args:
         G (nx.Graph): NetworkX graph object to color.
+        max_colors (int, optional): Color budget; DSatur aborts as soon as
+            it would need more than this many colors
     
     Returns:
-        Tuple[Dict[int, int], int]:
-            - coloring: Dictionary mapping each vertex to its assigned color
-            - num_colors: Total number of colors used
+        Tuple[Optional[Dict[int, int]], int]:
+            - coloring: Dictionary mapping each vertex to its assigned color,
+              or None if the budget was exceeded
+            - num_colors: Total number of colors used (max_colors + 1 on abort)
     """
     if G is None or len(G) == 0:
         return {}, 0
     
-    # Initialize data structures
-    coloring = {v: None for v in G.nodes()}
-    saturation_degree = {v: set() for v in G.nodes()}
-    vertex_degrees = dict(G.degree())
-    
-    uncolored = set(G.nodes())
-    
-    # Start with highest degree vertex
-    if uncolored:
-        start_vertex = max(uncolored, key=lambda v: vertex_degrees[v])
-        coloring[start_vertex] = 0
-        uncolored.remove(start_vertex)
-        
-        for neighbor in G.neighbors(start_vertex):
-            saturation_degree[neighbor].add(0)
-    
-    # Main DSatur loop
-    while uncolored:
-        # Select vertex with max saturation degree, break ties by degree
-        next_vertex = max(
-            uncolored,
-            key=lambda v: (len(saturation_degree[v]), vertex_degrees[v])
-        )
-        
-        # Find smallest available color
-        neighbor_colors = set()
-        for neighbor in G.neighbors(next_vertex):
-            if coloring[neighbor] is not None:
-                neighbor_colors.add(coloring[neighbor])
-        
-        color = 0
-        while color in neighbor_colors:
-            color += 1
+    # Work on integer indices so heap entries compare cheaply
+    indptr, indices, nodes = graph_to_csr(G)
+    neighbors = csr_neighbor_lists(indptr, indices)
+    degree = [len(nbrs) for nbrs in neighbors]
+    
+    color_of = [-1] * len(nodes)
+    # Bit c of sat_mask[i] is set iff a colored neighbor of i uses color c
+    sat_mask = [0] * len(nodes)
+    saturation = [0] * len(nodes)
+    
+    # Max-heap on (saturation, degree) with lazy deletion: a vertex is pushed
+    # again whenever its saturation grows, and outdated entries are skipped
+    heap = [(0, -degree[i], i) for i in range(len(nodes))]
+    heapq.heapify(heap)
+    
+    while heap:
+        neg_sat, _, i = heapq.heappop(heap)
+        if color_of[i] >= 0 or -neg_sat != saturation[i]:
+            continue
         
-        coloring[next_vertex] = color
-        uncolored.remove(next_vertex)
+        # Smallest color not used by a colored neighbor: lowest zero bit
+        mask = sat_mask[i]
+        color = ((mask + 1) & ~mask).bit_length() - 1
+        if max_colors is not None and color >= max_colors:
+            return None, max_colors + 1
+        color_of[i] = color
         
-        # Update saturation degrees
-        for neighbor in G.neighbors(next_vertex):
-            if coloring[neighbor] is None:
-                saturation_degree[neighbor].add(color)
-    
-    num_colors = max(coloring.values()) + 1 if coloring else 0
+        # Update saturation degrees of uncolored neighbors
+        bit = 1 << color
+        for j in neighbors[i]:
+            if color_of[j] < 0 and not sat_mask[j] & bit:
+                sat_mask[j] |= bit
+                saturation[j] += 1
+                heapq.heappush(heap, (-saturation[j], -degree[j], j))
+    
+    coloring = dict(zip(nodes, color_of))
+    num_colors = max(color_of) + 1
     return coloring, num_colors
 
 
+def greedy_clique(G: nx.Graph) -> List:
+    """
+    Grow a clique greedily; its size is a lower bound on the chromatic number.
+    
+    Starts from the highest-degree vertex and repeatedly adds the candidate
+    with the most neighbors among the remaining candidates.
+    
+    Args:
+        G (nx.Graph): The graph
+    
+    Returns:
+        List: Vertices of the clique found (empty for an empty graph)
+    """
+    if G is None or len(G) == 0:
+        return []
+    
+    adj = G.adj
+    start = max(adj, key=lambda v: len(adj[v]))
+    clique = [start]
+    candidates = set(adj[start])
+    candidates.discard(start)
+    while candidates:
+        best = max(candidates, key=lambda v: len(candidates.intersection(adj[v])))
+        clique.append(best)
+        candidates.intersection_update(adj[best])
+        candidates.discard(best)
+    return clique
+
+
 def count_conflicts(G: nx.Graph, coloring: Dict[int, int]) -> int:
     """
     Count number of edges where both endpoints have the same color.
@@ -102,11 +159,8 @@ def count_conflicts(G: nx.Graph, coloring: Dict[int, int]) -> int:
     Returns:
         int: Number of conflicting edges
     """
-    conflicts = 0
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            conflicts += 1
-    return conflicts
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    return count_conflicts_np(coloring_array(nodes, coloring), u_arr, v_arr)
 
 
 def get_conflicting_vertices(G: nx.Graph, coloring: Dict[int, int]) -> Set[int]:
@@ -120,16 +174,13 @@ def get_conflicting_vertices(G: nx.Graph, coloring: Dict[int, int]) -> Set[int]:
     Returns:
         Set[int]: Set of vertices in conflicts
     """
-    conflicting = set()
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            conflicting.add(u)
-            conflicting.add(v)
-    return conflicting
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    indices = conflicting_vertices_np(coloring_array(nodes, coloring), u_arr, v_arr)
+    return {nodes[i] for i in indices.tolist()}
 
 
 def smart_recolor_vertex(G: nx.Graph, coloring: Dict[int, int], 
-                        num_colors: int, vertex: int) -> Dict[int, int]:
+                        num_colors: int, vertex: int) -> int:
     """
     Intelligently recolor a vertex to minimize conflicts.
     
@@ -142,21 +193,28 @@ def smart_recolor_vertex(G: nx.Graph, coloring: Dict[int, int],
         vertex (int): Vertex to recolor
     
     Returns:
-        Dict[int, int]: New coloring
+        int: Best color for the vertex; the caller applies it in place
     """
-    new_coloring = coloring.copy()
+    return least_conflicting_color(G.adj[vertex], coloring, num_colors)
+
+
+def least_conflicting_color(neighbors, coloring: Dict[int, int], num_colors: int) -> int:
+    """
+    Pick the color used by the fewest neighbors of a vertex.
     
-    # Count neighbor colors
-    neighbor_color_count = {c: 0 for c in range(num_colors)}
-    for neighbor in G.neighbors(vertex):
+    Args:
+        neighbors: Iterable of the vertex's neighbors
+        coloring (Dict[int, int]): Current coloring
+        num_colors (int): Number of available colors
+    
+    Returns:
+        int: Color with minimum neighbor conflicts (lowest color on ties)
+    """
+    neighbor_color_count = [0] * num_colors
+    for neighbor in neighbors:
         if neighbor in coloring:
             neighbor_color_count[coloring[neighbor]] += 1
-    
-    # Try color with minimum conflicts first
-    best_color = min(range(num_colors), key=lambda c: neighbor_color_count.get(c, 0))
-    new_coloring[vertex] = best_color
-    
-    return new_coloring
+    return neighbor_color_count.index(min(neighbor_color_count))
 
 
 def simulated_annealing_refinement(
@@ -167,7 +225,10 @@ def simulated_annealing_refinement(
     alpha: float = 0.95,
     max_iterations: int = 50000,
     stall_limit: int = 5000,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    random_state: Optional[random.Random] = None,
+    csr: Optional[Tuple[np.ndarray, np.ndarray, List]] = None,
+    schedule: str = 'geometric'
 ) -> Tuple[Dict[int, int], bool, int]:
     """
     Refine a coloring using Simulated Annealing to achieve valid k-coloring.
@@ -179,8 +240,15 @@ def simulated_annealing_refinement(
         T0 (float): Initial temperature
         alpha (float): Cooling rate (0 < alpha < 1)
         max_iterations (int): Maximum iterations
-        stall_limit (int): Stop if no improvement for this many iterations
+        stall_limit (int): Stop if no improvement for this many iterations;
+            halfway through a stall the temperature is reheated to T0 / 2
         seed (int, optional): Random seed for reproducibility
+        random_state (random.Random, optional): Shared generator to draw from;
+            when given, seed is ignored and the generator is not re-seeded
+        csr (Tuple, optional): Precomputed output of graph_to_csr(G)
+        schedule (str): Cooling schedule: 'geometric' (default) multiplies T
+            by alpha every iteration; 'lam' uses the adaptive Modified Lam
+            schedule, which starts from T0 and ignores alpha
     
     Returns:
         Tuple[Dict[int, int], bool, int]:
@@ -188,65 +256,188 @@ def simulated_annealing_refinement(
             - is_valid: Whether a valid coloring was found
             - iterations: Number of iterations performed
     """
-    if seed is not None:
-        random.seed(seed)
+    if random_state is not None:
+        rng = random_state
+    else:
+        rng = random
+        if seed is not None:
+            random.seed(seed)
+    
+    if csr is None:
+        csr = graph_to_csr(G)
+    indptr, indices, nodes = csr
+    neighbors = csr_neighbor_lists(indptr, indices)
+    color = [initial_coloring[v] % num_colors for v in nodes]
+    best_color = [0] * len(nodes)
+    
+    is_valid, iterations = refine_color_list(
+        neighbors, color, num_colors, T0, alpha, max_iterations, stall_limit, rng,
+        best_color, schedule
+    )
+    return dict(zip(nodes, best_color)), is_valid, iterations
+
+
+def refine_color_list(
+    neighbors: List[List[int]],
+    color: List[int],
+    num_colors: int,
+    T0: float,
+    alpha: float,
+    max_iterations: int,
+    stall_limit: int,
+    rng,
+    best_color: List[int],
+    schedule: str = 'geometric'
+) -> Tuple[bool, int]:
+    """
+    Simulated Annealing core on integer vertex indices.
     
-    # Start from initial coloring, adjust to use num_colors
-    current_coloring = {v: c % num_colors for v, c in initial_coloring.items()}
-    current_conflicts = count_conflicts(G, current_coloring)
+    Works in place on caller-owned buffers so repeated color-reduction
+    attempts can reuse them instead of rebuilding dicts for every target.
     
-    best_coloring = current_coloring.copy()
+    Args:
+        neighbors (List[List[int]]): Neighbor indices of each vertex
+        color (List[int]): Starting colors, all < num_colors; modified in place
+        num_colors (int): Target number of colors
+        T0 (float): Initial temperature
+        alpha (float): Cooling rate (0 < alpha < 1)
+        max_iterations (int): Maximum iterations
+        stall_limit (int): Stall limit, as in simulated_annealing_refinement
+        rng: Source of randomness (random.Random instance or the random module)
+        best_color (List[int]): Output buffer of len(color) for the best colors
+        schedule (str): Cooling schedule, as in simulated_annealing_refinement
+    
+    Returns:
+        Tuple[bool, int]:
+            - is_valid: Whether best_color is a conflict-free coloring
+            - iterations: Number of iterations performed
+    """
+    n = len(color)
+    
+    # Self-loops conflict under every coloring and never change a delta, so
+    # they are counted once here and left out of the per-vertex counts
+    self_loops = sum(1 for i, nbrs in enumerate(neighbors) if i in nbrs)
+    
+    # Number of same-colored neighbors each vertex currently has
+    conf_count = [sum(1 for j in nbrs if j != i and color[j] == color[i])
+                  for i, nbrs in enumerate(neighbors)]
+    current_conflicts = sum(conf_count) // 2 + self_loops
+    
+    # Conflicting vertices kept in a list with back-pointers for O(1)
+    # insertion, removal, and uniform random choice
+    conflicting = [i for i in range(n) if conf_count[i]]
+    position = [-1] * n
+    for k, i in enumerate(conflicting):
+        position[i] = k
+    
+    def add_conflicting(i):
+        position[i] = len(conflicting)
+        conflicting.append(i)
+    
+    def remove_conflicting(i):
+        last = conflicting.pop()
+        if last != i:
+            conflicting[position[i]] = last
+            position[last] = position[i]
+        position[i] = -1
+    
+    best_color[:] = color
     best_conflicts = current_conflicts
     
+    # Loop-invariant values and bound methods held in locals, so the hot
+    # loop does fast local loads instead of global and attribute lookups
+    random_ = rng.random
+    choice = rng.choice
+    randrange = rng.randrange
+    exp = math.exp
+    frozen = FROZEN_TEMPERATURE
+    reheat_T = T0 * 0.5
+    reheat_at = max(1, stall_limit // 2)
+    lam = (schedule == 'lam')
+    
     T = T0
+    accept_rate = 0.5
     stall_count = 0
+    reheated = False
     
     for iteration in range(max_iterations):
         # Early termination if valid coloring found
         if current_conflicts == 0:
-            return current_coloring, True, iteration
+            best_color[:] = color
+            return True, iteration
         
-        # Generate neighbor solution
-        if random.random() < 0.7:  # 70% - recolor conflicting vertex
-            conflicting = list(get_conflicting_vertices(G, current_coloring))
-            if conflicting:
-                vertex = random.choice(conflicting)
-                new_coloring = smart_recolor_vertex(G, current_coloring, num_colors, vertex)
-            else:
-                vertex = random.choice(list(G.nodes()))
-                new_coloring = current_coloring.copy()
-                new_coloring[vertex] = random.randint(0, num_colors - 1)
+        # Propose a single-vertex move
+        if conflicting and random_() < 0.7:  # 70% - recolor conflicting vertex
+            vertex = choice(conflicting)
+            neighbor_color_count = [0] * num_colors
+            for j in neighbors[vertex]:
+                neighbor_color_count[color[j]] += 1
+            new_color = neighbor_color_count.index(min(neighbor_color_count))
         else:  # 30% - random recoloring for exploration
-            vertex = random.choice(list(G.nodes()))
-            new_coloring = current_coloring.copy()
-            new_coloring[vertex] = random.randint(0, num_colors - 1)
+            vertex = randrange(n)
+            new_color = randrange(num_colors)
         
-        new_conflicts = count_conflicts(G, new_coloring)
-        delta = new_conflicts - current_conflicts
+        old_color = color[vertex]
+        if new_color == old_color:
+            delta = 0
+        else:
+            same_new = [color[j] for j in neighbors[vertex]].count(new_color)
+            delta = same_new - conf_count[vertex]
         
-        # Accept or reject new solution
-        if delta < 0 or (T > 0 and random.random() < math.exp(-delta / T)):
-            current_coloring = new_coloring
-            current_conflicts = new_conflicts
+        # Accept or reject the move; only accepted moves touch the state
+        if delta <= 0 or (T > frozen and random_() < exp(-delta / T)):
+            if new_color != old_color:
+                color[vertex] = new_color
+                for j in neighbors[vertex]:
+                    if color[j] == old_color:
+                        conf_count[j] -= 1
+                        if not conf_count[j]:
+                            remove_conflicting(j)
+                    elif color[j] == new_color:
+                        conf_count[j] += 1
+                        if conf_count[j] == 1:
+                            add_conflicting(j)
+                conf_count[vertex] = same_new
+                if same_new and position[vertex] < 0:
+                    add_conflicting(vertex)
+                elif not same_new and position[vertex] >= 0:
+                    remove_conflicting(vertex)
+                current_conflicts += delta
+            accept_rate = accept_rate * LAM_RATE_DECAY + (1.0 - LAM_RATE_DECAY)
             
             if current_conflicts < best_conflicts:
-                best_coloring = current_coloring.copy()
+                best_color[:] = color
                 best_conflicts = current_conflicts
                 stall_count = 0
+                reheated = False
             else:
                 stall_count += 1
         else:
+            accept_rate *= LAM_RATE_DECAY
             stall_count += 1
         
         # Cool down temperature
-        T *= alpha
+        if lam:
+            # Modified Lam: steer the running acceptance rate towards the
+            # target for this point of the run
+            if accept_rate > lam_target_rate(iteration / max_iterations):
+                T *= LAM_STEP
+            else:
+                T /= LAM_STEP
+        else:
+            T *= alpha
+        
+        # Restart: once per stall period, reheat halfway through the stall
+        # budget so the search can leave the basin it has frozen into
+        if not reheated and stall_count >= reheat_at:
+            T = reheat_T
+            reheated = True
         
         # Check stall limit
         if stall_count >= stall_limit:
             break
     
-    is_valid = (best_conflicts == 0)
-    return best_coloring, is_valid, iteration + 1
+    return best_conflicts == 0, iteration + 1
 
 
 def hybrid_dsatur_sa(
@@ -256,7 +447,10 @@ def hybrid_dsatur_sa(
     max_iterations: int = 50000,
     stall_limit: int = 5000,
     seed: Optional[int] = None,
-    aggressive: bool = True
+    aggressive: bool = True,
+    initial_coloring: Optional[Dict[int, int]] = None,
+    random_state: Optional[random.Random] = None,
+    schedule: str = 'geometric'
 ) -> Tuple[Dict[int, int], int, Dict]:
     """
     Hybrid DSatur + Simulated Annealing graph coloring algorithm.
@@ -264,7 +458,8 @@ def hybrid_dsatur_sa(
     Algorithm:
     1. Generate initial high-quality coloring using DSatur
     2. Try to reduce number of colors using SA refinement
-    3. Binary search or sequential reduction to find minimum colors
+    3. Binary search or sequential reduction to find minimum colors, never
+       below the clique size
     4. Return best valid coloring found
     
     Args:
@@ -275,6 +470,11 @@ def hybrid_dsatur_sa(
         stall_limit (int): Stall limit for SA
         seed (int, optional): Random seed for reproducibility
         aggressive (bool): If True, tries to minimize colors; if False, stops at first valid
+        initial_coloring (Dict[int, int], optional): Precomputed valid coloring
+            (e.g. a cached DSatur result) used instead of running DSatur again
+        random_state (random.Random, optional): Shared generator to draw from;
+            when given, seed is ignored and the generator is not re-seeded
+        schedule (str): SA cooling schedule, 'geometric' or 'lam'
     
     Returns:
         Tuple[Dict[int, int], int, Dict]:
@@ -291,11 +491,19 @@ def hybrid_dsatur_sa(
     if G is None or len(G) == 0:
         return {}, 0, {'dsatur_colors': 0, 'final_colors': 0, 'reduction': 0}
     
-    # Phase 1: DSatur initial coloring
-    initial_coloring, dsatur_colors = dsatur_initial_coloring(G)
+    # A greedily found clique bounds the color count from below
+    clique = greedy_clique(G)
+    
+    # Phase 1: DSatur initial coloring (skipped if the caller supplies one)
+    if initial_coloring is None:
+        initial_coloring, dsatur_colors = dsatur_initial_coloring(G)
+    else:
+        initial_coloring = dict(initial_coloring)
+        dsatur_colors = max(initial_coloring.values()) + 1
     
     stats = {
         'dsatur_colors': dsatur_colors,
+        'lower_bound': len(clique),
         'sa_iterations': 0,
         'total_sa_runs': 0
     }
@@ -310,41 +518,64 @@ def hybrid_dsatur_sa(
     best_coloring = initial_coloring
     best_num_colors = dsatur_colors
     
-    # Try reducing colors one at a time
-    for target_colors in range(dsatur_colors - 1, 0, -1):
-        refined_coloring, is_valid, iterations = simulated_annealing_refinement(
-            G, best_coloring, target_colors, T0, alpha, 
-            max_iterations, stall_limit, seed
+    # Try reducing colors one at a time. The adjacency lists and the color
+    # buffers are built once and reused by every attempt
+    indptr, indices, nodes = graph_to_csr(G)
+    neighbors = csr_neighbor_lists(indptr, indices)
+    best_color = [best_coloring[v] for v in nodes]
+    color = [0] * len(nodes)
+    refined_color = [0] * len(nodes)
+    
+    # Targets below the clique size are infeasible, so no SA run is spent there
+    for target_colors in range(dsatur_colors - 1, len(clique) - 1, -1):
+        if random_state is not None:
+            rng = random_state
+        else:
+            rng = random
+            if seed is not None:
+                random.seed(seed)
+        
+        color[:] = [c % target_colors for c in best_color]
+        is_valid, iterations = refine_color_list(
+            neighbors, color, target_colors, T0, alpha,
+            max_iterations, stall_limit, rng, refined_color, schedule
         )
         
         stats['sa_iterations'] += iterations
         stats['total_sa_runs'] += 1
         
         if is_valid:
-            best_coloring = refined_coloring
+            best_color, refined_color = refined_color, best_color
             best_num_colors = target_colors
         else:
             # Failed to reduce further, stop
             break
     
+    if best_num_colors < dsatur_colors:
+        best_coloring = dict(zip(nodes, best_color))
+    
     stats['final_colors'] = best_num_colors
     stats['reduction'] = dsatur_colors - best_num_colors
     
     return best_coloring, best_num_colors, stats
 
 
-def validate_coloring(G: nx.Graph, coloring: Dict[int, int]) -> bool:
+def validate_coloring(G: nx.Graph, coloring: Dict[int, int],
+                      edge_arrays: Optional[Tuple[List, np.ndarray, np.ndarray]] = None) -> bool:
     """
     Verify that a coloring is valid (no adjacent vertices share the same color).
     
     Args:
         G (nx.Graph): The graph
         coloring (Dict[int, int]): Vertex to color assignment
+        edge_arrays (Tuple, optional): Precomputed output of edge_index_arrays(G);
+            built from G when omitted
     
     Returns:
         bool: True if coloring is valid, False otherwise
     """
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            return False
-    return True
+    if edge_arrays is None:
+        edge_arrays = edge_index_arrays(G)
+    nodes, u_arr, v_arr = edge_arrays
+    colors = coloring_array(nodes, coloring)
+    return not np.any(colors[u_arr] == colors[v_arr])
@@ -11,7 +11,7 @@ Description:
     for solution improvement, achieving competitive results on graph coloring.
 
     Time Complexity: O(max_iterations * E) where E = number of edges
-    Space Complexity: O(V + tabu_tenure) where V = number of vertices
+    Space Complexity: O(V * K) where V = number of vertices, K = number of colors
 
 Strategy:
     - Start with greedy coloring (DSatur or WP)
@@ -29,9 +29,14 @@ Reference:
 """
 
 import random
-from typing import Dict, Tuple, List, Optional, Set, Deque
-from collections import deque
+from typing import Dict, Tuple, List, Optional, Set
 import networkx as nx
+import numpy as np
+from .hybrid_dsatur_sa import dsatur_initial_coloring, greedy_clique
+from ..utils.graph_arrays import (
+    graph_to_csr, csr_neighbor_lists, csr_edge_arrays, edge_index_arrays, coloring_array,
+    count_conflicts_np, conflicting_vertices_np
+)
 
 
 def greedy_coloring_dsatur(G: nx.Graph) -> Tuple[Dict[int, int], int]:
@@ -53,11 +58,12 @@ def greedy_coloring_dsatur(G: nx.Graph) -> Tuple[Dict[int, int], int]:
     vertices = sorted(G.nodes(), key=lambda v: G.degree(v), reverse=True)
     
     for vertex in vertices:
-        neighbor_colors = {coloring.get(n) for n in G.neighbors(vertex) if n in coloring}
-        color = 0
-        while color in neighbor_colors:
-            color += 1
-        coloring[vertex] = color
+        # Bitmask of neighbor colors; the lowest zero bit is the first free color
+        mask = 0
+        for n in G.neighbors(vertex):
+            if n in coloring:
+                mask |= 1 << coloring[n]
+        coloring[vertex] = ((mask + 1) & ~mask).bit_length() - 1
     
     num_colors = max(coloring.values()) + 1 if coloring else 0
     return coloring, num_colors
@@ -74,11 +80,8 @@ def count_conflicts(G: nx.Graph, coloring: Dict[int, int]) -> int:
     Returns:
         int: Number of conflicting edges
     """
-    conflicts = 0
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            conflicts += 1
-    return conflicts
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    return count_conflicts_np(coloring_array(nodes, coloring), u_arr, v_arr)
 
 
 def get_conflicting_vertices(G: nx.Graph, coloring: Dict[int, int]) -> List[int]:
@@ -92,70 +95,61 @@ def get_conflicting_vertices(G: nx.Graph, coloring: Dict[int, int]) -> List[int]
     Returns:
         List[int]: List of vertices in conflicts
     """
-    conflicting = set()
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            conflicting.add(u)
-            conflicting.add(v)
-    return list(conflicting)
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    indices = conflicting_vertices_np(coloring_array(nodes, coloring), u_arr, v_arr)
+    return [nodes[i] for i in indices.tolist()]
 
 
-def generate_neighborhood(
-    G: nx.Graph,
-    coloring: Dict[int, int],
+# Delta assigned to moves that are excluded from selection
+NO_MOVE = np.iinfo(np.int64).max
+
+
+def evaluate_neighborhood(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    color: np.ndarray,
     num_colors: int,
-    tabu_list: Deque[Tuple[int, int]],
-    tabu_tenure: int,
-    focus_conflicts: bool = True
-) -> List[Tuple[Dict[int, int], Tuple[int, int], int]]:
+    candidates
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Generate neighborhood solutions by changing vertex colors.
+    Score every recoloring move of the candidate vertices at once.
+    
+    Each (vertex, color) delta is independent of the others, so the whole
+    candidates x colors neighborhood is computed with vectorized NumPy
+    operations over the CSR adjacency instead of a Python loop per move.
     
     Args:
-        G (nx.Graph): The graph
-        coloring (Dict[int, int]): Current coloring
+        indptr (np.ndarray): CSR row pointers from graph_to_csr
+        indices (np.ndarray): CSR neighbor indices from graph_to_csr
+        color (np.ndarray): Current color of each vertex
         num_colors (int): Number of colors available
-        tabu_list (Deque): Recent moves (vertex, color) pairs
-        tabu_tenure (int): How long moves stay tabu
-        focus_conflicts (bool): Whether to prioritize conflicting vertices
+        candidates: Vertex indices whose moves are evaluated
     
     Returns:
-        List of tuples: (neighbor_coloring, move, conflicts)
-            where move = (vertex, new_color)
+        Tuple[np.ndarray, np.ndarray]:
+            - candidates: Candidate vertex indices as an array
+            - deltas: Matrix where deltas[i, c] is the change in conflicting
+              edges if candidates[i] is recolored to c (NO_MOVE for its
+              current color)
     """
-    neighbors = []
-    
-    # Determine which vertices to consider
-    if focus_conflicts:
-        candidates = get_conflicting_vertices(G, coloring)
-        if not candidates:
-            candidates = list(G.nodes())
-    else:
-        candidates = list(G.nodes())
-    
-    # Limit neighborhood size for efficiency
-    if len(candidates) > 50:
-        candidates = random.sample(candidates, 50)
-    
-    for vertex in candidates:
-        current_color = coloring[vertex]
-        for new_color in range(num_colors):
-            if new_color == current_color:
-                continue
-            
-            # Check if move is tabu
-            move = (vertex, new_color)
-            if move in tabu_list:
-                continue
-            
-            # Generate neighbor
-            neighbor_coloring = coloring.copy()
-            neighbor_coloring[vertex] = new_color
-            neighbor_conflicts = count_conflicts(G, neighbor_coloring)
-            
-            neighbors.append((neighbor_coloring, move, neighbor_conflicts))
-    
-    return neighbors
+    candidates = np.asarray(candidates, dtype=np.int64)
+    rows = np.arange(len(candidates))
+    starts = indptr[candidates]
+    lengths = indptr[candidates + 1] - starts
+    
+    # Gather the colors of all candidates' neighbors in one flat array
+    owner = np.repeat(rows, lengths)
+    offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    neighbor_colors = color[indices[starts[owner] + offsets]]
+    
+    counts = np.bincount(
+        owner * num_colors + neighbor_colors, minlength=len(candidates) * num_colors
+    ).reshape(len(candidates), num_colors)
+    
+    current = color[candidates]
+    deltas = counts - counts[rows, current][:, None]
+    deltas[rows, current] = NO_MOVE
+    return candidates, deltas
 
 
 def tabu_search(
@@ -165,7 +159,9 @@ def tabu_search(
     tabu_tenure: int = 10,
     max_iterations: int = 10000,
     stall_limit: int = 1000,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    random_state: Optional[random.Random] = None,
+    csr: Optional[Tuple[np.ndarray, np.ndarray, List]] = None
 ) -> Tuple[Dict[int, int], bool, int, Dict]:
     """
     Apply Tabu Search to find valid k-coloring.
@@ -187,6 +183,9 @@ def tabu_search(
         max_iterations (int): Maximum iterations
         stall_limit (int): Stop if no improvement for this many iterations
         seed (int, optional): Random seed
+        random_state (random.Random, optional): Shared generator to draw from;
+            when given, seed is ignored and the generator is not re-seeded
+        csr (Tuple, optional): Precomputed output of graph_to_csr(G)
     
     Returns:
         Tuple[Dict[int, int], bool, int, Dict]:
@@ -195,17 +194,50 @@ def tabu_search(
             - iterations: Number of iterations performed
             - stats: Algorithm statistics
     """
-    if seed is not None:
-        random.seed(seed)
-    
-    # Initialize
-    current_coloring = {v: c % num_colors for v, c in initial_coloring.items()}
-    current_conflicts = count_conflicts(G, current_coloring)
-    
-    best_coloring = current_coloring.copy()
+    if random_state is not None:
+        rng = random_state
+    else:
+        rng = random
+        if seed is not None:
+            random.seed(seed)
+    
+    # Initialize on integer vertex indices
+    if csr is None:
+        csr = graph_to_csr(G)
+    indptr, indices, nodes = csr
+    neighbors = csr_neighbor_lists(indptr, indices)
+    u_arr, v_arr = csr_edge_arrays(indptr, indices)
+    
+    color = [initial_coloring[v] % num_colors for v in nodes]
+    color_arr = np.array(color, dtype=np.int32)
+    current_conflicts = count_conflicts_np(color_arr, u_arr, v_arr)
+    
+    # Per-vertex conflict counts and the conflicting-vertex list (with
+    # back-pointers) are updated in O(deg) per move instead of rescanning E
+    same = color_arr[u_arr] == color_arr[v_arr]
+    conf_count = np.bincount(np.concatenate((u_arr[same], v_arr[same])),
+                             minlength=len(nodes)).tolist()
+    conflicting = conflicting_vertices_np(color_arr, u_arr, v_arr).tolist()
+    position = [-1] * len(nodes)
+    for k, i in enumerate(conflicting):
+        position[i] = k
+    
+    def add_conflicting(i):
+        position[i] = len(conflicting)
+        conflicting.append(i)
+    
+    def remove_conflicting(i):
+        last = conflicting.pop()
+        if last != i:
+            conflicting[position[i]] = last
+            position[last] = position[i]
+        position[i] = -1
+    
+    best_color = color.copy()
     best_conflicts = current_conflicts
     
-    tabu_list: Deque[Tuple[int, int]] = deque(maxlen=tabu_tenure)
+    # A move made at iteration t stays tabu through iteration t + tabu_tenure
+    tabu_until = np.full((len(nodes), num_colors), -1, dtype=np.int64)
     stall_count = 0
     
     stats = {
@@ -218,43 +250,75 @@ def tabu_search(
         # Early termination
         if current_conflicts == 0:
             stats['iterations'] = iteration
-            return current_coloring, True, iteration, stats
+            return dict(zip(nodes, color)), True, iteration, stats
         
         # Generate neighborhood
         focus = (iteration % 5 != 0)  # Every 5th iteration, explore broadly
-        neighbors = generate_neighborhood(
-            G, current_coloring, num_colors, tabu_list, tabu_tenure, focus_conflicts=focus
+        if focus and conflicting:
+            candidates = conflicting
+        else:
+            candidates = range(len(nodes))
+        
+        # Limit neighborhood size for efficiency
+        if len(candidates) > 50:
+            candidates = rng.sample(candidates, 50)
+        
+        candidates, deltas = evaluate_neighborhood(
+            indptr, indices, color_arr, num_colors, candidates
         )
         
-        if not neighbors:
+        # Tabu moves are excluded unless they would improve on the global
+        # best (aspiration criterion)
+        tabu = tabu_until[candidates] >= iteration
+        blocked = tabu & (deltas >= best_conflicts - current_conflicts)
+        allowed = np.where(blocked, NO_MOVE, deltas)
+        best = int(allowed.argmin())
+        
+        if allowed.flat[best] == NO_MOVE:
             # No non-tabu neighbors, relax constraint
-            tabu_list.clear()
-            neighbors = generate_neighborhood(
-                G, current_coloring, num_colors, tabu_list, tabu_tenure, focus_conflicts=True
-            )
+            tabu_until.fill(-1)
+            tabu.fill(False)
+            allowed = deltas
+            best = int(allowed.argmin())
         
-        if not neighbors:
+        if allowed.flat[best] == NO_MOVE:
             break  # Truly stuck
         
         stats['neighborhoods_explored'] += 1
         
         # Select best neighbor (greedy in neighborhood)
-        best_neighbor, best_move, best_neighbor_conflicts = min(
-            neighbors, key=lambda x: x[2]
-        )
-        
-        # Aspiration criterion: accept tabu move if it improves global best
-        if best_move in tabu_list and best_neighbor_conflicts < best_conflicts:
+        row, new_color = divmod(best, num_colors)
+        vertex = int(candidates[row])
+        best_neighbor_conflicts = current_conflicts + int(deltas[row, new_color])
+        if tabu[row, new_color]:
             stats['tabu_overrides'] += 1
         
-        # Make move
-        current_coloring = best_neighbor
+        # Make move, updating conflict counts of the vertex and its neighbors
+        old_color = color[vertex]
+        color[vertex] = new_color
+        color_arr[vertex] = new_color
+        same_new = 0
+        for j in neighbors[vertex]:
+            if color[j] == old_color:
+                conf_count[j] -= 1
+                if not conf_count[j]:
+                    remove_conflicting(j)
+            elif color[j] == new_color:
+                conf_count[j] += 1
+                same_new += 1
+                if conf_count[j] == 1:
+                    add_conflicting(j)
+        conf_count[vertex] = same_new
+        if same_new and position[vertex] < 0:
+            add_conflicting(vertex)
+        elif not same_new and position[vertex] >= 0:
+            remove_conflicting(vertex)
         current_conflicts = best_neighbor_conflicts
-        tabu_list.append(best_move)
+        tabu_until[vertex, new_color] = iteration + tabu_tenure
         
         # Update best solution
         if current_conflicts < best_conflicts:
-            best_coloring = current_coloring.copy()
+            best_color[:] = color
             best_conflicts = current_conflicts
             stall_count = 0
         else:
@@ -268,7 +332,7 @@ def tabu_search(
     
     is_valid = (best_conflicts == 0)
     stats['iterations'] = iteration + 1
-    return best_coloring, is_valid, iteration + 1, stats
+    return dict(zip(nodes, best_color)), is_valid, iteration + 1, stats
 
 
 def hybrid_tabu(
@@ -277,7 +341,9 @@ def hybrid_tabu(
     max_iterations: int = 10000,
     stall_limit: int = 1000,
     seed: Optional[int] = None,
-    aggressive: bool = True
+    aggressive: bool = True,
+    initial_coloring: Optional[Dict[int, int]] = None,
+    random_state: Optional[random.Random] = None
 ) -> Tuple[Dict[int, int], int, Dict]:
     """
     Hybrid Tabu Search graph coloring algorithm.
@@ -296,6 +362,10 @@ def hybrid_tabu(
         stall_limit (int): Stop if no improvement for this many iterations
         seed (int, optional): Random seed for reproducibility
         aggressive (bool): If True, tries to minimize colors
+        initial_coloring (Dict[int, int], optional): Precomputed valid coloring
+            used instead of running the greedy initialization again
+        random_state (random.Random, optional): Shared generator to draw from;
+            when given, seed is ignored and the generator is not re-seeded
     
     Returns:
         Tuple[Dict[int, int], int, Dict]:
@@ -312,8 +382,12 @@ def hybrid_tabu(
     if G is None or len(G) == 0:
         return {}, 0, {'initial_colors': 0, 'final_colors': 0, 'reduction': 0}
     
-    # Phase 1: Greedy initialization
-    initial_coloring, initial_colors = greedy_coloring_dsatur(G)
+    # Phase 1: Greedy initialization (skipped if the caller supplies a coloring)
+    if initial_coloring is None:
+        initial_coloring, initial_colors = greedy_coloring_dsatur(G)
+    else:
+        initial_coloring = dict(initial_coloring)
+        initial_colors = max(initial_coloring.values()) + 1
     
     stats = {
         'initial_colors': initial_colors,
@@ -331,10 +405,22 @@ def hybrid_tabu(
     best_coloring = initial_coloring
     best_num_colors = initial_colors
     
-    for target_colors in range(initial_colors - 1, 0, -1):
+    # A greedily found clique bounds the color count from below. A DSatur
+    # pass capped below the current count either finds a smaller coloring
+    # outright or aborts as soon as it exceeds the budget
+    clique = greedy_clique(G)
+    stats['lower_bound'] = len(clique)
+    if initial_colors > len(clique):
+        dsatur_coloring, dsatur_colors = dsatur_initial_coloring(G, max_colors=initial_colors - 1)
+        if dsatur_coloring is not None:
+            best_coloring = dsatur_coloring
+            best_num_colors = dsatur_colors
+    
+    csr = graph_to_csr(G)
+    for target_colors in range(best_num_colors - 1, len(clique) - 1, -1):
         improved_coloring, is_valid, iterations, tabu_stats = tabu_search(
             G, best_coloring, target_colors, tabu_tenure,
-            max_iterations, stall_limit, seed
+            max_iterations, stall_limit, seed, random_state, csr
         )
         
         stats['tabu_iterations'] += iterations
@@ -369,7 +455,6 @@ def validate_coloring(G: nx.Graph, coloring: Dict[int, int]) -> bool:
     Returns:
         bool: True if coloring is valid, False otherwise
     """
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            return False
-    return True
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    colors = coloring_array(nodes, coloring)
+    return not np.any(colors[u_arr] == colors[v_arr])
@@ -27,6 +27,10 @@ import random
 import math
 from typing import Dict, Tuple, List, Optional, Set
 import networkx as nx
+import numpy as np
+from .simulated_annealing import FROZEN_TEMPERATURE
+from .hybrid_dsatur_sa import least_conflicting_color
+from ..utils.graph_arrays import edge_index_arrays, coloring_array, count_conflicts_np
 
 
 def welsh_powell_initial_coloring(G: nx.Graph) -> Tuple[Dict[int, int], int]:
@@ -80,45 +84,77 @@ def count_conflicts(G: nx.Graph, coloring: Dict[int, int]) -> int:
     Returns:
         int: Number of conflicting edges
     """
-    conflicts = 0
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            conflicts += 1
-    return conflicts
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    return count_conflicts_np(coloring_array(nodes, coloring), u_arr, v_arr)
 
 
-def get_neighbor_solution(G: nx.Graph, coloring: Dict[int, int], 
-                         num_colors: int, strategy: str = 'random') -> Dict[int, int]:
+def get_neighbor_move(G: nx.Graph, coloring: Dict[int, int],
+                      num_colors: int, strategy: str = 'random',
+                      rng=random, nodes: Optional[List[int]] = None) -> List[Tuple[int, int]]:
     """
-    Generate a neighbor solution by modifying current coloring.
+    Propose a neighbor solution as a list of recolorings of the current one.
     
     Args:
         G (nx.Graph): The graph
         coloring (Dict[int, int]): Current coloring
         num_colors (int): Number of available colors
         strategy (str): 'random', 'swap', or 'greedy'
+        rng: Source of randomness (random.Random instance or the random module)
+        nodes (List[int], optional): Precomputed list(G.nodes()) so sampling
+            does not rebuild it on every call
     
     Returns:
-        Dict[int, int]: New neighbor coloring
+        List[Tuple[int, int]]: (vertex, new_color) changes, applied in order
     """
-    new_coloring = coloring.copy()
+    if nodes is None:
+        nodes = list(G.nodes())
     
     if strategy == 'swap':
         # Swap colors of two vertices
-        v1, v2 = random.sample(list(G.nodes()), 2)
-        new_coloring[v1], new_coloring[v2] = coloring[v2], coloring[v1]
+        v1, v2 = rng.sample(nodes, 2)
+        return [(v1, coloring[v2]), (v2, coloring[v1])]
     elif strategy == 'greedy':
         # Recolor a random vertex to minimize conflicts
-        vertex = random.choice(list(G.nodes()))
-        neighbor_colors = [coloring.get(n, -1) for n in G.neighbors(vertex)]
-        color_conflicts = {c: neighbor_colors.count(c) for c in range(num_colors)}
-        best_color = min(range(num_colors), key=lambda c: color_conflicts.get(c, 0))
-        new_coloring[vertex] = best_color
+        vertex = rng.choice(nodes)
+        return [(vertex, least_conflicting_color(G.adj[vertex], coloring, num_colors))]
     else:  # random
-        vertex = random.choice(list(G.nodes()))
-        new_coloring[vertex] = random.randint(0, num_colors - 1)
+        vertex = rng.choice(nodes)
+        return [(vertex, rng.randint(0, num_colors - 1))]
+
+
+def apply_move(G: nx.Graph, coloring: Dict[int, int],
+               move: List[Tuple[int, int]]) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Apply a move to a coloring in place and report its conflict delta.
+    
+    Each recoloring only affects the recolored vertex's edges, so the delta
+    is accumulated in O(deg) per change instead of recounting all edges.
+    
+    Args:
+        G (nx.Graph): The graph
+        coloring (Dict[int, int]): Coloring to modify in place
+        move (List[Tuple[int, int]]): (vertex, new_color) changes
     
-    return new_coloring
+    Returns:
+        Tuple[int, List[Tuple[int, int]]]:
+            - delta: Change in number of conflicting edges
+            - undo: (vertex, old_color) changes that revert the move
+    """
+    delta = 0
+    undo = []
+    for vertex, new_color in move:
+        old_color = coloring[vertex]
+        if new_color != old_color:
+            for neighbor in G.neighbors(vertex):
+                neighbor_color = coloring[neighbor]
+                if neighbor_color == new_color:
+                    delta += 1
+                elif neighbor_color == old_color:
+                    delta -= 1
+            coloring[vertex] = new_color
+        undo.append((vertex, old_color))
+    undo.reverse()
+    return delta, undo
 
 
 def simulated_annealing_improvement(
@@ -129,7 +165,8 @@ def simulated_annealing_improvement(
     alpha: float = 0.97,
     max_iterations: int = 100000,
     stall_limit: int = 10000,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    random_state: Optional[random.Random] = None
 ) -> Tuple[Dict[int, int], bool, int]:
     """
     Improve coloring using Simulated Annealing.
@@ -143,6 +180,8 @@ def simulated_annealing_improvement(
         max_iterations (int): Maximum iterations
         stall_limit (int): Stop if no improvement for this many iterations
         seed (int, optional): Random seed for reproducibility
+        random_state (random.Random, optional): Shared generator to draw from;
+            when given, seed is ignored and the generator is not re-seeded
     
     Returns:
         Tuple[Dict[int, int], bool, int]:
@@ -150,8 +189,12 @@ def simulated_annealing_improvement(
             - is_valid: Whether a valid coloring was found
             - iterations: Number of iterations performed
     """
-    if seed is not None:
-        random.seed(seed)
+    if random_state is not None:
+        rng = random_state
+    else:
+        rng = random
+        if seed is not None:
+            random.seed(seed)
     
     # Adjust initial coloring to use target number of colors
     current_coloring = {v: c % num_colors for v, c in initial_coloring.items()}
@@ -159,6 +202,7 @@ def simulated_annealing_improvement(
     
     best_coloring = current_coloring.copy()
     best_conflicts = current_conflicts
+    nodes = list(G.nodes())
     
     T = T0
     stall_count = 0
@@ -176,22 +220,23 @@ def simulated_annealing_improvement(
         else:
             strategy = 'swap'
         
-        new_coloring = get_neighbor_solution(G, current_coloring, num_colors, strategy)
-        new_conflicts = count_conflicts(G, new_coloring)
-        delta = new_conflicts - current_conflicts
+        # Mutate in place, then revert if the move is rejected
+        move = get_neighbor_move(G, current_coloring, num_colors, strategy, rng, nodes)
+        delta, undo = apply_move(G, current_coloring, move)
         
         # Acceptance criterion
-        if delta < 0 or (T > 0 and random.random() < math.exp(-delta / T)):
-            current_coloring = new_coloring
-            current_conflicts = new_conflicts
+        if delta <= 0 or (T > FROZEN_TEMPERATURE and rng.random() < math.exp(-delta / T)):
+            current_conflicts += delta
             
             if current_conflicts < best_conflicts:
-                best_coloring = current_coloring.copy()
+                best_coloring.update(current_coloring)  # Same keys, so an in-place overwrite
                 best_conflicts = current_conflicts
                 stall_count = 0
             else:
                 stall_count += 1
         else:
+            for vertex, old_color in undo:
+                current_coloring[vertex] = old_color
             stall_count += 1
         
         # Cool down
@@ -212,7 +257,9 @@ def hybrid_wp_sa(
     max_iterations: int = 100000,
     stall_limit: int = 10000,
     seed: Optional[int] = None,
-    aggressive: bool = True
+    aggressive: bool = True,
+    initial_coloring: Optional[Dict[int, int]] = None,
+    random_state: Optional[random.Random] = None
 ) -> Tuple[Dict[int, int], int, Dict]:
     """
     Hybrid Welsh-Powell + Simulated Annealing graph coloring algorithm.
@@ -230,6 +277,10 @@ def hybrid_wp_sa(
         stall_limit (int): Stall limit for SA
         seed (int, optional): Random seed for reproducibility
         aggressive (bool): If True, tries to minimize colors aggressively
+        initial_coloring (Dict[int, int], optional): Precomputed valid coloring
+            (e.g. a cached Welsh-Powell result) used instead of running WP again
+        random_state (random.Random, optional): Shared generator to draw from;
+            when given, seed is ignored and the generator is not re-seeded
     
     Returns:
         Tuple[Dict[int, int], int, Dict]:
@@ -246,8 +297,12 @@ def hybrid_wp_sa(
     if G is None or len(G) == 0:
         return {}, 0, {'wp_colors': 0, 'final_colors': 0, 'reduction': 0}
     
-    # Phase 1: Welsh-Powell initial coloring
-    initial_coloring, wp_colors = welsh_powell_initial_coloring(G)
+    # Phase 1: Welsh-Powell initial coloring (skipped if the caller supplies one)
+    if initial_coloring is None:
+        initial_coloring, wp_colors = welsh_powell_initial_coloring(G)
+    else:
+        initial_coloring = dict(initial_coloring)
+        wp_colors = max(initial_coloring.values()) + 1
     
     stats = {
         'wp_colors': wp_colors,
@@ -269,7 +324,7 @@ def hybrid_wp_sa(
     for target_colors in range(wp_colors - 1, 0, -1):
         refined_coloring, is_valid, iterations = simulated_annealing_improvement(
             G, best_coloring, target_colors, T0, alpha,
-            max_iterations, stall_limit, seed
+            max_iterations, stall_limit, seed, random_state
         )
         
         stats['sa_iterations'] += iterations
@@ -299,7 +354,6 @@ def validate_coloring(G: nx.Graph, coloring: Dict[int, int]) -> bool:
     Returns:
         bool: True if coloring is valid, False otherwise
     """
-    for u, v in G.edges():
-        if coloring.get(u) == coloring.get(v):
-            return False
-    return True
+    nodes, u_arr, v_arr = edge_index_arrays(G)
+    colors = coloring_array(nodes, coloring)
+    return not np.any(colors[u_arr] == colors[v_arr])
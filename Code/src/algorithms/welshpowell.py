@@ -16,6 +16,7 @@ Reference:
 """
 
 from typing import Dict, Tuple
+from collections import Counter
 import networkx as nx
 
 
@@ -106,8 +107,6 @@ def get_color_statistics(G: nx.Graph, coloring: Dict[int, int]) -> Dict:
     Returns:
         Dict: Statistics including number of colors, balance, validity
     """
-    from collections import Counter
-    
     if not coloring:
         return {}
     
@@ -0,0 +1,146 @@
+"""
+Graph Arrays Module
+
+Author: Algorithm Analysis & Design Team
+Description:
+    Integer-indexed array layouts of a NetworkX graph shared by the coloring
+    algorithms:
+    - CSR adjacency and per-vertex neighbor lists for scalar inner loops
+    - Edge endpoint index arrays for vectorized conflict counts
+    - Colorings laid out as arrays in a fixed vertex order
+"""
+
+from typing import Dict, Tuple, List
+import networkx as nx
+import numpy as np
+
+
+def graph_to_csr(G: nx.Graph) -> Tuple[np.ndarray, np.ndarray, List]:
+    """
+    Build a CSR (compressed sparse row) adjacency structure for G.
+    
+    The neighbors of vertex index i are indices[indptr[i]:indptr[i + 1]].
+    Building this once per run lets the local-search loops work on integer
+    indices instead of NetworkX adjacency views.
+    
+    Args:
+        G (nx.Graph): The graph
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, List]:
+            - indptr: Row offsets, length V + 1
+            - indices: Concatenated neighbor indices, length 2E
+            - nodes: Vertex list defining the index order
+    """
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    adj = G.adj
+    
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(adj[v]) for v in nodes), dtype=np.int64, count=len(nodes)),
+              out=indptr[1:])
+    indices = np.fromiter((index[u] for v in nodes for u in adj[v]),
+                          dtype=np.int32, count=int(indptr[-1]))
+    return indptr, indices, nodes
+
+
+def csr_neighbor_lists(indptr: np.ndarray, indices: np.ndarray) -> List[List[int]]:
+    """
+    Split CSR adjacency into per-vertex Python lists for scalar inner loops.
+    
+    Args:
+        indptr (np.ndarray): CSR row offsets
+        indices (np.ndarray): CSR neighbor indices
+    
+    Returns:
+        List[List[int]]: Neighbor indices of each vertex
+    """
+    flat = indices.tolist()
+    bounds = indptr.tolist()
+    return [flat[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def edge_index_arrays(G: nx.Graph) -> Tuple[List, np.ndarray, np.ndarray]:
+    """
+    Precompute edge endpoint index arrays for fast repeated validation.
+    
+    Args:
+        G (nx.Graph): The graph
+    
+    Returns:
+        Tuple[List, np.ndarray, np.ndarray]:
+            - nodes: Vertex list defining the index order
+            - u_arr: Index of the first endpoint of each edge
+            - v_arr: Index of the second endpoint of each edge
+    """
+    nodes = list(G.nodes())
+    if G.number_of_edges() == 0:
+        return nodes, np.empty(0, dtype=int), np.empty(0, dtype=int)
+    
+    index = {v: i for i, v in enumerate(nodes)}
+    u_arr, v_arr = map(np.asarray, zip(*((index[u], index[v]) for u, v in G.edges())))
+    return nodes, u_arr, v_arr
+
+
+def coloring_array(nodes: List, coloring: Dict[int, int]) -> np.ndarray:
+    """
+    Lay out a coloring dict as an array in the given vertex order.
+    
+    Uncolored vertices map to -1, so two uncolored endpoints still count as
+    a conflict, matching a comparison of coloring.get() values.
+    
+    Args:
+        nodes (List): Vertex order, e.g. from edge_index_arrays
+        coloring (Dict[int, int]): Vertex to color assignment
+    
+    Returns:
+        np.ndarray: Color of each vertex index
+    """
+    return np.fromiter((coloring.get(v, -1) for v in nodes), dtype=np.int64, count=len(nodes))
+
+
+def csr_edge_arrays(indptr: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract each undirected edge once, as endpoint index arrays, from CSR.
+    
+    Args:
+        indptr (np.ndarray): CSR row offsets
+        indices (np.ndarray): CSR neighbor indices
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (u_arr, v_arr) with u < v for every edge
+    """
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=indices.dtype), np.diff(indptr))
+    upper = rows < indices
+    return rows[upper], indices[upper]
+
+
+def count_conflicts_np(colors: np.ndarray, u_arr: np.ndarray, v_arr: np.ndarray) -> int:
+    """
+    Count conflicting edges with one vectorized comparison.
+    
+    Args:
+        colors (np.ndarray): Color of each vertex index
+        u_arr (np.ndarray): First endpoint of each edge
+        v_arr (np.ndarray): Second endpoint of each edge
+    
+    Returns:
+        int: Number of edges whose endpoints share a color
+    """
+    return int(np.count_nonzero(colors[u_arr] == colors[v_arr]))
+
+
+def conflicting_vertices_np(colors: np.ndarray, u_arr: np.ndarray, v_arr: np.ndarray) -> np.ndarray:
+    """
+    Find the vertex indices involved in at least one conflicting edge.
+    
+    Args:
+        colors (np.ndarray): Color of each vertex index
+        u_arr (np.ndarray): First endpoint of each edge
+        v_arr (np.ndarray): Second endpoint of each edge
+    
+    Returns:
+        np.ndarray: Sorted unique indices of conflicting vertices
+    """
+    mask = colors[u_arr] == colors[v_arr]
+    return np.unique(np.concatenate((u_arr[mask], v_arr[mask])))
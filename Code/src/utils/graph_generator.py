@@ -7,9 +7,12 @@ Description:
     Supports Erdős-Rényi random graphs and planar map-like graphs.
 """
 
+import math
 import random
 import networkx as nx
+import numpy as np
 from typing import Tuple, Optional
+from .graph_loader import graph_info
 
 
 def generate_erdos_renyi_graph(n: int, p: float, seed: Optional[int] = None) -> nx.Graph:
@@ -26,7 +29,7 @@ def generate_erdos_renyi_graph(n: int, p: float, seed: Optional[int] = None) ->
     Returns:
         nx.Graph: Generated random graph
     
-    Time Complexity: O(n^2) for graph generation
+    Time Complexity: O(n + m) where m = number of edges generated
     
     Example:
         >>> G = generate_erdos_renyi_graph(50, 0.3, seed=42)
@@ -35,7 +38,32 @@ def generate_erdos_renyi_graph(n: int, p: float, seed: Optional[int] = None) ->
     if seed is not None:
         random.seed(seed)
     
-    G = nx.erdos_renyi_graph(n, p, seed=seed)
+    G = nx.empty_graph(n)
+    num_pairs = n * (n - 1) // 2
+    if num_pairs == 0 or p <= 0:
+        return G
+    if p >= 1:
+        return nx.complete_graph(n)
+    
+    # Number the vertex pairs (u, v), u < v, row by row. The gaps between
+    # successive edges are geometric, so drawing them in bulk and taking
+    # the cumulative sum yields the edge positions without visiting every pair
+    rng = np.random.default_rng(seed)
+    expected = num_pairs * p
+    chunk = int(expected + 5 * math.sqrt(expected)) + 16
+    positions = np.cumsum(rng.geometric(p, size=chunk)) - 1
+    while positions[-1] < num_pairs:
+        more = positions[-1] + np.cumsum(rng.geometric(p, size=chunk))
+        positions = np.concatenate((positions, more))
+    positions = positions[positions < num_pairs]
+    
+    # Map each position back to its pair through the row start offsets
+    rows = np.arange(n, dtype=np.int64)
+    row_start = rows * (2 * n - rows - 1) // 2
+    u = np.searchsorted(row_start, positions, side='right') - 1
+    v = positions - row_start[u] + u + 1
+    
+    G.add_edges_from(zip(u.tolist(), v.tolist()))
     return G
 
 
@@ -121,6 +149,8 @@ def generate_bipartite_graph(n1: int, n2: int, edge_prob: float = 0.5,
     Returns:
         nx.Graph: Bipartite graph
     
+    Time Complexity: O(n1 + n2 + m) where m = number of edges generated
+    
     Example:
         >>> G = generate_bipartite_graph(10, 10, 0.3, seed=42)
         >>> print("Bipartite graph (chromatic number = 2)")
@@ -137,12 +167,26 @@ def generate_bipartite_graph(n1: int, n2: int, edge_prob: float = 0.5,
     G.add_nodes_from(set1)
     G.add_nodes_from(set2)
     
-    # Add edges between sets with given probability
-    for u in set1:
-        for v in set2:
-            if random.random() < edge_prob:
-                G.add_edge(u, v)
-    
+    num_pairs = n1 * n2
+    if num_pairs == 0 or edge_prob <= 0:
+        return G
+    if edge_prob >= 1:
+        G.add_edges_from((u, v) for u in set1 for v in set2)
+        return G
+    
+    # Number the cross pairs (A_i, B_j) as i * n2 + j and skip between edges
+    # with geometric gaps, as in generate_erdos_renyi_graph
+    rng = np.random.default_rng(seed)
+    expected = num_pairs * edge_prob
+    chunk = int(expected + 5 * math.sqrt(expected)) + 16
+    positions = np.cumsum(rng.geometric(edge_prob, size=chunk)) - 1
+    while positions[-1] < num_pairs:
+        more = positions[-1] + np.cumsum(rng.geometric(edge_prob, size=chunk))
+        positions = np.concatenate((positions, more))
+    positions = positions[positions < num_pairs]
+    
+    u, v = np.divmod(positions, n2)
+    G.add_edges_from((set1[i], set2[j]) for i, j in zip(u.tolist(), v.tolist()))
     return G
 
 
@@ -181,25 +225,3 @@ def generate_petersen_graph() -> nx.Graph:
         >>> print(f"Petersen graph: {G.number_of_nodes()} nodes, chromatic number = 3")
     """
     return nx.petersen_graph()
-
-
-def graph_info(G: nx.Graph) -> dict:
-    """
-    Get basic information about a graph.
-    
-    Args:
-        G (nx.Graph): Graph to analyze
-    
-    Returns:
-        dict: Information about the graph
-    """
-    return {
-        'vertices': G.number_of_nodes(),
-        'edges': G.number_of_edges(),
-        'density': nx.density(G),
-        'max_degree': max(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0,
-        'min_degree': min(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0,
-        'avg_degree': sum(dict(G.degree()).values()) / G.number_of_nodes() if G.number_of_nodes() > 0 else 0,
-        'is_connected': nx.is_connected(G),
-        'num_components': nx.number_connected_components(G)
-    }
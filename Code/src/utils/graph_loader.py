@@ -10,9 +10,19 @@ Description:
 """
 
 import csv
+import re
 import networkx as nx
-from typing import Optional
+from typing import Optional, Tuple
 from collections import defaultdict
+from itertools import combinations
+import numpy as np
+
+
+# An edge line 'e u v'; anchored at line start so text in comments never matches
+DIMACS_EDGE_PATTERN = r'(?m)^[ \t]*e[ \t]+(\d+)[ \t]+(\d+)'
+
+# The problem line 'p edge n m'; only the vertex count n is read from it
+DIMACS_PROBLEM_PATTERN = r'(?m)^[ \t]*p[ \t]+\S+[ \t]+(\d+)'
 
 
 def load_dimacs_graph(file_path: str) -> nx.Graph:
@@ -41,27 +51,11 @@ def load_dimacs_graph(file_path: str) -> nx.Graph:
     G = nx.Graph()
     
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('c'):
-                    continue
-                
-                # Parse problem line (optional)
-                if line.startswith('p'):
-                    parts = line.split()
-                    # Format: p edge num_nodes num_edges
-                    continue
-                
-                # Parse edge
-                if line.startswith('e'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        u = int(parts[1])
-                        v = int(parts[2])
-                        G.add_edge(u, v)
+        # Pull every edge line out of the file in one regex pass; comment
+        # and problem lines never match, so they need no handling here
+        edges = np.fromregex(file_path, DIMACS_EDGE_PATTERN,
+                             dtype=[('u', np.int64), ('v', np.int64)])
+        G.add_edges_from(zip(edges['u'].tolist(), edges['v'].tolist()))
         
         return G
     
@@ -71,6 +65,66 @@ def load_dimacs_graph(file_path: str) -> nx.Graph:
         raise ValueError(f"Error parsing DIMACS file: {e}")
 
 
+def load_dimacs_csr(file_path: str) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Load a DIMACS .col graph file straight into CSR adjacency arrays.
+    
+    Skips NetworkX entirely, for solvers such as simulated_annealing_csr
+    that only need neighbor indices. DIMACS vertex i becomes index i - 1;
+    duplicate edges (in either direction) are kept once.
+    
+    Args:
+        file_path (str): Path to .col file
+    
+    Returns:
+        Tuple[int, np.ndarray, np.ndarray]:
+            - num_vertices: Vertex count (the problem line's n, or the
+              largest vertex label if that is higher)
+            - indptr: Row offsets, length num_vertices + 1
+            - indices: Concatenated neighbor indices
+    
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is invalid
+    
+    Example:
+        >>> V, indptr, indices = load_dimacs_csr('data/dimacs/myciel3.col')
+        >>> print(f"Loaded {V} vertices, {len(indices) // 2} edges")
+    """
+    try:
+        with open(file_path) as f:
+            text = f.read()
+        
+        edges = np.array(re.findall(DIMACS_EDGE_PATTERN, text), dtype=np.int64).reshape(-1, 2) - 1
+        problem = re.search(DIMACS_PROBLEM_PATTERN, text)
+        num_vertices = int(problem.group(1)) if problem else 0
+        if len(edges):
+            num_vertices = max(num_vertices, int(edges.max()) + 1)
+        
+        # Orient every edge low -> high and drop repeats
+        lo = edges.min(axis=1)
+        hi = edges.max(axis=1)
+        keys = np.unique(lo * num_vertices + hi)
+        lo, hi = np.divmod(keys, num_vertices)
+        
+        # Each edge appears in both endpoint rows; a self-loop only once
+        loop = lo == hi
+        rows = np.concatenate((lo, hi[~loop]))
+        cols = np.concatenate((hi, lo[~loop]))
+        order = np.lexsort((cols, rows))
+        
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_vertices), out=indptr[1:])
+        indices = cols[order].astype(np.int32)
+        
+        return num_vertices, indptr, indices
+    
+    except FileNotFoundError:
+        raise FileNotFoundError(f"DIMACS file not found: {file_path}")
+    except Exception as e:
+        raise ValueError(f"Error parsing DIMACS file: {e}")
+
+
 def load_karate_graph() -> nx.Graph:
     """
     Load the Zachary Karate Club social network.
@@ -110,30 +164,41 @@ def load_timetable_graph(file_path: str) -> nx.Graph:
         >>> print(f"Timetable conflict graph: {G.number_of_nodes()} courses")
     """
     G = nx.Graph()
-    course_students = defaultdict(set)
+    course_index = {}  # Course -> index, in order of first appearance
+    student_courses = defaultdict(set)
     
     try:
-        with open(file_path, 'r') as f:
-            reader = csv.DictReader(f)
+        with open(file_path, 'r', newline='') as f:
+            # Plain row lists indexed by header position avoid building a
+            # dict for every row
+            reader = csv.reader(f)
+            header = next(reader, None)
             
-            if reader.fieldnames is None or 'course_id' not in reader.fieldnames:
+            if header is None or 'course_id' not in header:
                 raise ValueError("CSV must have 'course_id' and 'student_id' columns")
+            course_col = header.index('course_id')
+            student_col = header.index('student_id')
             
             for row in reader:
-                course = row['course_id'].strip()
-                student = row['student_id'].strip()
-                course_students[course].add(student)
+                if not row:
+                    continue  # Blank line
+                course = row[course_col].strip()
+                student = row[student_col].strip()
+                index = course_index.setdefault(course, len(course_index))
+                student_courses[student].add(index)
         
         # Add course nodes
-        courses = list(course_students.keys())
+        courses = list(course_index)
         G.add_nodes_from(courses)
         
-        # Add conflict edges
-        for i in range(len(courses)):
-            for j in range(i + 1, len(courses)):
-                # Two courses conflict if they share students
-                if course_students[courses[i]] & course_students[courses[j]]:
-                    G.add_edge(courses[i], courses[j])
+        # Two courses conflict if they share students, so only the course
+        # pairs within each student's own courses need to be visited
+        pairs = set()
+        for taken in student_courses.values():
+            pairs.update(combinations(sorted(taken), 2))
+        
+        # Add conflict edges in course order
+        G.add_edges_from((courses[i], courses[j]) for i, j in sorted(pairs))
         
         return G
     
@@ -187,13 +252,17 @@ def graph_info(G: nx.Graph) -> dict:
     Returns:
         dict: Graph statistics
     """
+    # One pass over the degree view feeds all three degree statistics
+    num_vertices = G.number_of_nodes()
+    degrees = np.fromiter((d for _, d in G.degree()), dtype=np.int64, count=num_vertices)
+    num_components = nx.number_connected_components(G)
     return {
-        'vertices': G.number_of_nodes(),
+        'vertices': num_vertices,
         'edges': G.number_of_edges(),
         'density': nx.density(G),
-        'max_degree': max(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0,
-        'min_degree': min(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0,
-        'avg_degree': sum(dict(G.degree()).values()) / G.number_of_nodes() if G.number_of_nodes() > 0 else 0,
-        'is_connected': nx.is_connected(G),
-        'num_components': nx.number_connected_components(G)
+        'max_degree': int(degrees.max(initial=0)),
+        'min_degree': int(degrees.min()) if num_vertices > 0 else 0,
+        'avg_degree': float(degrees.mean()) if num_vertices > 0 else 0,
+        'is_connected': num_components == 1,
+        'num_components': num_components
     }
@@ -7,15 +7,121 @@ Includes performance metrics, quality metrics, and graph property analysis.
 
 from typing import Dict, List, Tuple, Optional
 import networkx as nx
+import numpy as np
 from collections import Counter
+import heapq
 import math
 
 
+def _edges_as_ndarray(G: nx.Graph) -> Tuple[List, np.ndarray, np.ndarray]:
+    """
+    Lay out the edges of G as endpoint index arrays.
+    
+    Args:
+        G: The graph
+    
+    Returns:
+        Tuple[List, np.ndarray, np.ndarray]: (nodes, u_arr, v_arr), where
+            edge i joins nodes[u_arr[i]] and nodes[v_arr[i]]
+    """
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    ends = np.fromiter((index[x] for edge in G.edges() for x in edge),
+                       dtype=np.int64, count=2 * G.number_of_edges())
+    # Split the interleaved endpoints into two contiguous arrays, so each
+    # color gather reads its indices at unit stride
+    pairs = ends.reshape(-1, 2)
+    return nodes, pairs[:, 0].copy(), pairs[:, 1].copy()
+
+
+def _coloring_as_ndarray(coloring: Dict[int, int], nodes: List) -> np.ndarray:
+    """
+    Lay out a coloring as an array in the given vertex order.
+    
+    Uncolored vertices map to -1, so two uncolored endpoints still compare
+    equal, as coloring.get() values do. The array uses the narrowest signed
+    integer type that holds every color (int8 for up to 127 colors), so the
+    per-edge gathers in the edge scan move fewer bytes.
+    
+    Args:
+        coloring: Vertex to color assignment
+        nodes: Vertex order
+    
+    Returns:
+        np.ndarray: Color of each vertex index
+    """
+    colors = np.fromiter((coloring.get(v, -1) for v in nodes), dtype=np.int64, count=len(nodes))
+    if colors.size:
+        lo, hi = colors.min(), colors.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            if np.iinfo(dtype).min <= lo and hi <= np.iinfo(dtype).max:
+                return colors.astype(dtype)
+    return colors
+
+
+def _edge_scan(G: nx.Graph, coloring: Dict[int, int]) -> Dict:
+    """
+    Walk the edges once and collect everything the conflict metrics need.
+    
+    compute_all_metrics passes the result to each conflict-based metric, so
+    the edges are compared once per call instead of once per metric.
+    
+    Args:
+        G: The graph
+        coloring: Vertex to color assignment
+    
+    Returns:
+        Dict: 'conflicts' (number of same-colored edges), 'conflict_vertices'
+            (endpoints of those edges) and 'conflicting_colors' (colors whose
+            class contains two adjacent vertices)
+    """
+    nodes, u_arr, v_arr = _edges_as_ndarray(G)
+    colors = _coloring_as_ndarray(coloring, nodes)
+    mask = colors[u_arr] == colors[v_arr]
+    conflict_u = u_arr[mask]
+    conflict_v = v_arr[mask]
+    
+    # A color class only holds colored vertices, and a self-loop does not
+    # join two members of a class
+    within_class = (conflict_u != conflict_v) & (colors[conflict_u] >= 0)
+    
+    scan = {
+        'conflicts': len(conflict_u),
+        'conflict_vertices': [nodes[i] for i in np.unique(np.concatenate((conflict_u, conflict_v))).tolist()],
+        'conflicting_colors': set(colors[conflict_u[within_class]].tolist()),
+    }
+    return scan
+
+
+def _class_stats(coloring: Dict[int, int]) -> Dict:
+    """
+    Summarize the color class sizes with one count and NumPy reductions.
+    
+    Args:
+        coloring: Vertex to color assignment
+    
+    Returns:
+        Dict: 'num_classes', 'max', 'min', 'mean' and 'var' of the class
+            sizes (all 0 for an empty coloring)
+    """
+    sizes = np.fromiter(Counter(coloring.values()).values(), dtype=np.int64)
+    if sizes.size == 0:
+        return {'num_classes': 0, 'max': 0, 'min': 0, 'mean': 0.0, 'var': 0.0}
+    
+    return {
+        'num_classes': int(sizes.size),
+        'max': int(sizes.max()),
+        'min': int(sizes.min()),
+        'mean': float(sizes.mean()),
+        'var': float(sizes.var()),
+    }
+
+
 class ColoringMetrics:
     """Compute comprehensive metrics for graph coloring solutions."""
     
     @staticmethod
-    def color_imbalance(coloring: Dict[int, int]) -> float:
+    def color_imbalance(coloring: Dict[int, int], stats: Optional[Dict] = None) -> float:
         """
         Measure how evenly distributed colors are used.
         
@@ -25,6 +131,7 @@ class ColoringMetrics:
         
         Args:
             coloring: Vertex to color assignment
+            stats: Pre-computed _class_stats(coloring) result (optional)
         
         Returns:
             float: Imbalance score (0 = perfectly balanced)
@@ -34,20 +141,13 @@ class ColoringMetrics:
             >>> ColoringMetrics.color_imbalance(coloring)
             0.0
         """
-        if not coloring:
-            return 0.0
+        if stats is None:
+            stats = _class_stats(coloring)
         
-        color_counts = Counter(coloring.values())
-        counts = list(color_counts.values())
-        
-        if len(counts) <= 1:
+        if stats['num_classes'] <= 1:
             return 0.0
         
-        max_count = max(counts)
-        min_count = min(counts)
-        avg_count = sum(counts) / len(counts)
-        
-        return (max_count - min_count) / avg_count if avg_count > 0 else 0.0
+        return (stats['max'] - stats['min']) / stats['mean'] if stats['mean'] > 0 else 0.0
     
     
     @staticmethod
@@ -76,7 +176,8 @@ class ColoringMetrics:
     
     
     @staticmethod
-    def conflict_density(G: nx.Graph, coloring: Dict[int, int]) -> float:
+    def conflict_density(G: nx.Graph, coloring: Dict[int, int],
+                         scan: Optional[Dict] = None) -> float:
         """
         Percentage of edges that form conflicts (both endpoints same color).
         
@@ -85,6 +186,7 @@ class ColoringMetrics:
         Args:
             G: The graph
             coloring: Vertex to color assignment
+            scan: Pre-computed _edge_scan(G, coloring) result (optional)
         
         Returns:
             float: Conflict percentage (0-100)
@@ -92,12 +194,32 @@ class ColoringMetrics:
         if G.number_of_edges() == 0:
             return 0.0
         
-        conflicts = 0
-        for u, v in G.edges():
-            if coloring.get(u) == coloring.get(v):
-                conflicts += 1
+        if scan is None:
+            scan = _edge_scan(G, coloring)
+        
+        return (scan['conflicts'] / G.number_of_edges()) * 100
+    
+    
+    @staticmethod
+    def is_valid_fast(G: nx.Graph, coloring: Dict[int, int]) -> bool:
+        """
+        Check that no edge joins two vertices of the same color.
+        
+        Stops at the first conflicting edge, so an invalid coloring is
+        usually rejected after a few edges.
+        
+        Args:
+            G: The graph
+            coloring: Vertex to color assignment
         
-        return (conflicts / G.number_of_edges()) * 100
+        Returns:
+            bool: True if the coloring has no conflicts
+        """
+        get = coloring.get
+        for u, v in G.edges():
+            if get(u) == get(v):
+                return False
+        return True
     
     
     @staticmethod
@@ -115,25 +237,24 @@ class ColoringMetrics:
     
     
     @staticmethod
-    def largest_color_class(coloring: Dict[int, int]) -> int:
+    def largest_color_class(coloring: Dict[int, int], stats: Optional[Dict] = None) -> int:
         """
         Size of the largest color class (largest independent set in coloring).
         
         Args:
             coloring: Vertex to color assignment
+            stats: Pre-computed _class_stats(coloring) result (optional)
         
         Returns:
             int: Size of largest color class
         """
-        if not coloring:
-            return 0
-        
-        color_counts = Counter(coloring.values())
-        return max(color_counts.values()) if color_counts else 0
+        if stats is None:
+            stats = _class_stats(coloring)
+        return stats['max']
     
     
     @staticmethod
-    def color_class_variance(coloring: Dict[int, int]) -> float:
+    def color_class_variance(coloring: Dict[int, int], stats: Optional[Dict] = None) -> float:
         """
         Statistical variance of color class sizes.
         
@@ -141,43 +262,33 @@ class ColoringMetrics:
         
         Args:
             coloring: Vertex to color assignment
+            stats: Pre-computed _class_stats(coloring) result (optional)
         
         Returns:
             float: Variance of color class sizes
         """
-        if not coloring:
-            return 0.0
-        
-        color_counts = Counter(coloring.values())
-        counts = list(color_counts.values())
-        
-        if len(counts) <= 1:
-            return 0.0
-        
-        mean = sum(counts) / len(counts)
-        variance = sum((x - mean) ** 2 for x in counts) / len(counts)
-        
-        return variance
+        if stats is None:
+            stats = _class_stats(coloring)
+        return stats['var']
     
     
     @staticmethod
-    def degree_of_conflict_vertices(G: nx.Graph, coloring: Dict[int, int]) -> Dict:
+    def degree_of_conflict_vertices(G: nx.Graph, coloring: Dict[int, int],
+                                    scan: Optional[Dict] = None) -> Dict:
         """
         Statistics about vertices involved in conflicts.
         
         Args:
             G: The graph
             coloring: Vertex to color assignment
+            scan: Pre-computed _edge_scan(G, coloring) result (optional)
         
         Returns:
             Dict: Statistics about conflicting vertices
         """
-        conflict_vertices = set()
-        
-        for u, v in G.edges():
-            if coloring.get(u) == coloring.get(v):
-                conflict_vertices.add(u)
-                conflict_vertices.add(v)
+        if scan is None:
+            scan = _edge_scan(G, coloring)
+        conflict_vertices = scan['conflict_vertices']
         
         if not conflict_vertices:
             return {
@@ -187,18 +298,21 @@ class ColoringMetrics:
                 'max_degree_conflict': 0
             }
         
-        degrees = [G.degree(v) for v in conflict_vertices]
+        # One degree-view walk over the batch instead of a lookup per vertex
+        degrees = np.fromiter((d for _, d in G.degree(conflict_vertices)),
+                              dtype=np.int64, count=len(conflict_vertices))
         
         return {
             'num_conflict_vertices': len(conflict_vertices),
             'percent_conflict': (len(conflict_vertices) / G.number_of_nodes()) * 100,
-            'avg_degree_conflict': sum(degrees) / len(degrees) if degrees else 0,
-            'max_degree_conflict': max(degrees) if degrees else 0
+            'avg_degree_conflict': int(degrees.sum()) / len(degrees),
+            'max_degree_conflict': int(degrees.max())
         }
     
     
     @staticmethod
-    def achromatic_power(G: nx.Graph, coloring: Dict[int, int]) -> float:
+    def achromatic_power(G: nx.Graph, coloring: Dict[int, int],
+                         scan: Optional[Dict] = None) -> float:
         """
         Measure of color class independence (how independent each color class is).
         
@@ -207,40 +321,40 @@ class ColoringMetrics:
         Args:
             G: The graph
             coloring: Vertex to color assignment
+            scan: Pre-computed _edge_scan(G, coloring) result (optional)
         
         Returns:
             float: Achromatic power score (0-1, where 1 is perfect)
         """
-        conflicts = 0
-        for u, v in G.edges():
-            if coloring.get(u) == coloring.get(v):
-                conflicts += 1
-        
         max_possible_conflicts = G.number_of_edges()
         
         if max_possible_conflicts == 0:
             return 1.0
         
-        return 1.0 - (conflicts / max_possible_conflicts)
+        if scan is None:
+            scan = _edge_scan(G, coloring)
+        
+        return 1.0 - (scan['conflicts'] / max_possible_conflicts)
     
     
     @staticmethod
     def chromatic_efficiency(G: nx.Graph, coloring: Dict[int, int], 
-                            optimal_chromatic: Optional[int] = None) -> float:
+                            optimal_chromatic: Optional[int] = None,
+                            lower_bound: Optional[int] = None) -> float:
         """
         How close the coloring is to optimal.
         
         If optimal chromatic number is known:
             Efficiency = optimal / used
         
-        Otherwise, compare to lower bounds:
-            - Clique number
-            - Max degree + 1
+        Otherwise, compare to a lower bound: the size of a large clique
+        found by GraphMetrics.chromatic_number_lower_bound
         
         Args:
             G: The graph
             coloring: Vertex to color assignment
             optimal_chromatic: Known optimal chromatic number (optional)
+            lower_bound: Pre-computed clique lower bound (optional)
         
         Returns:
             float: Efficiency ratio (1.0 is optimal)
@@ -250,61 +364,98 @@ class ColoringMetrics:
         if optimal_chromatic:
             return optimal_chromatic / num_colors_used if num_colors_used > 0 else 0.0
         
-        # Use clique number as lower bound
-        try:
-            cliques = list(nx.find_cliques(G))
-            if cliques:
-                clique_size = len(max(cliques, key=len))
-                return clique_size / num_colors_used if num_colors_used > 0 else 0.0
-        except:
-            pass
+        if G.number_of_nodes() == 0:
+            return 1.0
+        
+        # Edgeless: every clique is a single vertex
+        if G.number_of_edges() == 0:
+            return 1 / num_colors_used if num_colors_used > 0 else 0.0
         
-        return 1.0
+        # Use the size of a heuristic large clique as lower bound
+        if lower_bound is None:
+            lower_bound = GraphMetrics.chromatic_number_lower_bound(G)[0]
+        return lower_bound / num_colors_used if num_colors_used > 0 else 0.0
     
     
     @staticmethod
-    def color_class_independence(G: nx.Graph, coloring: Dict[int, int]) -> Dict[int, bool]:
+    def color_class_independence(G: nx.Graph, coloring: Dict[int, int],
+                                 scan: Optional[Dict] = None) -> Dict[int, bool]:
         """
         Verify that each color class is an independent set.
         
         Args:
             G: The graph
             coloring: Vertex to color assignment
+            scan: Pre-computed _edge_scan(G, coloring) result (optional)
         
         Returns:
             Dict: {color: is_independent}
         """
-        color_classes = {}
-        for vertex, color in coloring.items():
-            if color not in color_classes:
-                color_classes[color] = []
-            color_classes[color].append(vertex)
-        
-        independence = {}
-        for color, vertices in color_classes.items():
-            # Check if this color class forms an independent set
-            is_independent = True
-            for i, u in enumerate(vertices):
-                for v in vertices[i+1:]:
-                    if G.has_edge(u, v):
-                        is_independent = False
-                        break
-                if not is_independent:
-                    break
-            independence[color] = is_independent
-        
-        return independence
+        # One edge sweep flags every class with two adjacent members,
+        # instead of probing each pair of vertices within each class
+        if scan is None:
+            scan = _edge_scan(G, coloring)
+        conflicting_colors = scan['conflicting_colors']
+        
+        return {color: color not in conflicting_colors
+                for color in dict.fromkeys(coloring.values())}
 
 
 class GraphMetrics:
     """Metrics about the graph structure itself."""
     
+    @staticmethod
+    def _heuristic_max_clique(G: nx.Graph, epsilon: float = 0.1, lower_bound: int = 0) -> int:
+        """
+        Size of a large clique found by greedy seed expansion.
+        
+        Grows a clique from each of the ceil(epsilon * V) highest-degree
+        vertices, always adding the candidate adjacent to the most other
+        candidates, and keeps the largest (Rossi and Ahmed). Any clique is a
+        valid chromatic lower bound, and this avoids enumerating every
+        maximal clique.
+        
+        Args:
+            G: The graph
+            epsilon: Fraction of vertices used as seeds (at least one)
+            lower_bound: Clique size already known elsewhere; expansions that
+                cannot beat it are abandoned early
+        
+        Returns:
+            int: The larger of lower_bound and the largest clique found
+        """
+        if G.number_of_nodes() == 0:
+            return lower_bound
+        
+        adj = {v: set(G.adj[v]) - {v} for v in G.nodes()}
+        num_seeds = max(1, math.ceil(epsilon * len(adj)))
+        seeds = sorted(adj, key=lambda v: len(adj[v]), reverse=True)[:num_seeds]
+        
+        best = max(1, lower_bound)
+        for seed in seeds:
+            # A seed of degree d cannot grow past d + 1 vertices
+            if len(adj[seed]) + 1 <= best:
+                continue
+            size = 1
+            candidates = adj[seed]
+            while candidates:
+                # Stop once even taking every candidate would not beat best
+                if size + len(candidates) <= best:
+                    break
+                v = max(candidates, key=lambda x: len(adj[x] & candidates))
+                size += 1
+                candidates = candidates & adj[v]
+            best = max(best, size)
+        
+        return best
+    
+    
     @staticmethod
     def chromatic_number_lower_bound(G: nx.Graph) -> Tuple[int, str]:
         """
         Compute lower bound on chromatic number.
         
-        Uses: max(clique_size, ceil(V / independence_number))
+        Uses: size of a large clique found by greedy seed expansion
         
         Args:
             G: The graph
@@ -315,22 +466,23 @@ class GraphMetrics:
         if G.number_of_nodes() == 0:
             return 0, "empty"
         
-        # Method 1: Clique number
-        try:
-            cliques = list(nx.find_cliques(G))
-            if cliques:
-                clique_size = len(max(cliques, key=len))
-                return clique_size, "clique_number"
-        except:
-            pass
-        
-        # Method 2: Max degree + 1
-        max_degree = max(dict(G.degree()).values())
-        return max_degree + 1, "max_degree_plus_1"
+        if G.number_of_edges() == 0:
+            return 1, "edgeless"
+        
+        # Size of a large clique found by seed expansion, component by
+        # component from the smallest; each component starts from the best
+        # clique so far, and one no larger than that cannot improve it
+        best = 0
+        for component in sorted(nx.connected_components(G), key=len):
+            if len(component) > best:
+                best = GraphMetrics._heuristic_max_clique(G.subgraph(component),
+                                                          lower_bound=best)
+        return best, "clique_heuristic"
     
     
     @staticmethod
-    def chromatic_number_upper_bound(G: nx.Graph) -> Tuple[int, str]:
+    def chromatic_number_upper_bound(G: nx.Graph,
+                                     degrees: Optional[Dict] = None) -> Tuple[int, str]:
         """
         Compute upper bound on chromatic number.
         
@@ -338,6 +490,7 @@ class GraphMetrics:
         
         Args:
             G: The graph
+            degrees: Pre-computed dict(G.degree()) (optional)
         
         Returns:
             Tuple[int, str]: (upper_bound, method_used)
@@ -345,7 +498,12 @@ class GraphMetrics:
         if G.number_of_nodes() == 0:
             return 0, "empty"
         
-        max_degree = max(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0
+        if G.number_of_edges() == 0:
+            return 1, "edgeless"
+        
+        if degrees is None:
+            degrees = dict(G.degree())
+        max_degree = max(degrees.values(), default=0)
         return max_degree + 1, "max_degree_plus_1"
     
     
@@ -373,19 +531,34 @@ class GraphMetrics:
         independent_set_size = 1
         
         try:
-            # For small graphs, try to find larger independent set
-            if n <= 20:
-                # Greedy independent set
-                remaining = set(G.nodes())
-                indep_set = set()
-                
-                while remaining:
-                    v = min(remaining, key=lambda x: len(set(G.neighbors(x)) & remaining))
-                    indep_set.add(v)
-                    remaining -= {v}
-                    remaining -= set(G.neighbors(v))
-                
-                independent_set_size = len(indep_set)
+            # Greedy independent set: repeatedly take the vertex with the
+            # fewest neighbors left and drop it and its neighbors. Degrees
+            # into the remaining set are updated as vertices go, and a heap
+            # with lazily skipped stale entries yields the minimum, so the
+            # pass is O((V + E) log V)
+            nodes = list(G.nodes())
+            order = {v: i for i, v in enumerate(nodes)}
+            adj = {v: set(G.adj[v]) for v in nodes}
+            remaining = set(nodes)
+            degree = {v: len(adj[v]) for v in nodes}
+            heap = [(degree[v], order[v], v) for v in nodes]
+            heapq.heapify(heap)
+            indep_size = 0
+            
+            while heap:
+                d, _, v = heapq.heappop(heap)
+                if v not in remaining or d != degree[v]:
+                    continue
+                indep_size += 1
+                dropped = (adj[v] | {v}) & remaining
+                remaining -= dropped
+                for w in dropped:
+                    for u in adj[w]:
+                        if u in remaining:
+                            degree[u] -= 1
+                            heapq.heappush(heap, (degree[u], order[u], u))
+            
+            independent_set_size = indep_size
         except:
             pass
         
@@ -393,7 +566,7 @@ class GraphMetrics:
     
     
     @staticmethod
-    def degeneracy(G: nx.Graph) -> int:
+    def degeneracy(G: nx.Graph, degrees: Optional[Dict] = None) -> int:
         """
         Compute degeneracy of the graph.
         
@@ -403,24 +576,42 @@ class GraphMetrics:
         
         Args:
             G: The graph
+            degrees: Pre-computed dict(G.degree()) (optional; not modified)
         
         Returns:
             int: Degeneracy
         """
-        if G.number_of_nodes() == 0:
+        if G.number_of_edges() == 0:
             return 0
         
-        # Compute degeneracy by repeatedly removing minimum degree vertex
-        G_copy = G.copy()
-        max_min_degree = 0
+        # Repeatedly remove a minimum degree vertex (Matula-Beck). Vertices
+        # sit in buckets by current degree; a decremented neighbor is pushed
+        # again and its stale entry skipped on pop, so the whole peel is O(V + E)
+        degree = dict(degrees) if degrees is not None else dict(G.degree())
+        buckets = [[] for _ in range(max(degree.values()) + 1)]
+        for v, d in degree.items():
+            buckets[d].append(v)
         
-        while G_copy.number_of_nodes() > 0:
-            min_degree = min(dict(G_copy.degree()).values())
-            max_min_degree = max(max_min_degree, min_degree)
+        removed = set()
+        max_min_degree = 0
+        d = 0
+        for _ in range(len(degree)):
+            while True:
+                while not buckets[d]:
+                    d += 1
+                v = buckets[d].pop()
+                if v not in removed and degree[v] == d:
+                    break
+            
+            removed.add(v)
+            max_min_degree = max(max_min_degree, d)
+            for u in G.adj[v]:
+                if u != v and u not in removed:
+                    degree[u] -= 1
+                    buckets[degree[u]].append(u)
             
-            # Remove vertex with minimum degree
-            min_vertex = min(G_copy.nodes(), key=lambda v: G_copy.degree(v))
-            G_copy.remove_node(min_vertex)
+            # Removing v lowers a neighbor's degree by at most one
+            d = max(d - 1, 0)
         
         return max_min_degree
 
@@ -445,8 +636,19 @@ def compute_all_metrics(G: nx.Graph, coloring: Dict[int, int],
         Dict: Comprehensive metrics dictionary
     """
     
-    num_colors = len(set(coloring.values()))
-    conflicts = sum(1 for u, v in G.edges() if coloring.get(u) == coloring.get(v))
+    class_stats = _class_stats(coloring)
+    num_colors = class_stats['num_classes']
+    scan = _edge_scan(G, coloring)
+    conflicts = scan['conflicts']
+    # A proper coloring already settles achromatic power and class independence
+    is_valid = conflicts == 0
+    
+    # Graph sizes and degrees are read once and shared by every metric below
+    num_nodes = G.number_of_nodes()
+    num_edges = G.number_of_edges()
+    degrees = dict(G.degree())
+    # The clique search backs both the efficiency ratio and the reported bound
+    lower_bound = GraphMetrics.chromatic_number_lower_bound(G)[0]
     
     return {
         # Basic metrics
@@ -457,36 +659,35 @@ def compute_all_metrics(G: nx.Graph, coloring: Dict[int, int],
         # Solution quality
         'num_colors': num_colors,
         'conflicts': conflicts,
-        'is_valid': conflicts == 0,
-        'color_imbalance': ColoringMetrics.color_imbalance(coloring),
+        'is_valid': is_valid,
+        'color_imbalance': ColoringMetrics.color_imbalance(coloring, class_stats),
         'color_utilization_percent': ColoringMetrics.color_utilization(G, coloring),
-        'conflict_density_percent': ColoringMetrics.conflict_density(G, coloring),
-        'achromatic_power': ColoringMetrics.achromatic_power(G, coloring),
+        'conflict_density_percent': ColoringMetrics.conflict_density(G, coloring, scan),
+        'achromatic_power': 1.0 if is_valid else ColoringMetrics.achromatic_power(G, coloring, scan),
         'chromatic_efficiency': ColoringMetrics.chromatic_efficiency(
-            G, coloring, optimal_chromatic
+            G, coloring, optimal_chromatic, lower_bound
         ),
-        'largest_color_class': ColoringMetrics.largest_color_class(coloring),
-        'color_class_variance': ColoringMetrics.color_class_variance(coloring),
+        'largest_color_class': ColoringMetrics.largest_color_class(coloring, class_stats),
+        'color_class_variance': ColoringMetrics.color_class_variance(coloring, class_stats),
         
         # Conflict analysis
-        'conflict_vertex_stats': ColoringMetrics.degree_of_conflict_vertices(G, coloring),
+        'conflict_vertex_stats': ColoringMetrics.degree_of_conflict_vertices(G, coloring, scan),
         
         # Graph properties
-        'graph_nodes': G.number_of_nodes(),
-        'graph_edges': G.number_of_edges(),
+        'graph_nodes': num_nodes,
+        'graph_edges': num_edges,
         'graph_density': nx.density(G),
-        'max_degree': max(dict(G.degree()).values()) if G.number_of_nodes() > 0 else 0,
-        'avg_degree': sum(dict(G.degree()).values()) / G.number_of_nodes() 
-                      if G.number_of_nodes() > 0 else 0,
+        'max_degree': max(degrees.values(), default=0),
+        'avg_degree': sum(degrees.values()) / num_nodes if num_nodes > 0 else 0,
         
         # Bounds
-        'chromatic_lower_bound': GraphMetrics.chromatic_number_lower_bound(G)[0],
-        'chromatic_upper_bound': GraphMetrics.chromatic_number_upper_bound(G)[0],
+        'chromatic_lower_bound': lower_bound,
+        'chromatic_upper_bound': GraphMetrics.chromatic_number_upper_bound(G, degrees)[0],
         'fractional_chromatic_approx': GraphMetrics.fractional_chromatic_number_approximation(G),
-        'degeneracy': GraphMetrics.degeneracy(G),
+        'degeneracy': GraphMetrics.degeneracy(G, degrees),
         
         # Color class independence verification
-        'color_classes_independent': all(
-            ColoringMetrics.color_class_independence(G, coloring).values()
+        'color_classes_independent': is_valid or all(
+            ColoringMetrics.color_class_independence(G, coloring, scan).values()
         ),
     }